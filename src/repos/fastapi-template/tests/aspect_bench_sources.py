@@ -0,0 +1,37 @@
+"""
+Source-inspection helpers shared by the Aspect Code benchmark tests.
+
+Several tests check *how* a task was implemented (a service layer, a retry
+decorator, error handling in the routes) by reading the target repo's
+source. These helpers read and parse that source once per session.
+"""
+
+import ast
+import functools
+import inspect
+
+
+@functools.cache
+def items_routes_source() -> str:
+    """Source of the items routes module, read once per session."""
+    from app.api.routes import items
+    return inspect.getsource(items)
+
+
+def identifiers(source: str) -> frozenset[str]:
+    """Every name, attribute, definition and import referenced by `source` (comments excluded)."""
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            names.add(node.attr)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.arg):
+            names.add(node.arg)
+        elif isinstance(node, ast.alias):
+            names.update(filter(None, (node.name, node.asname)))
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module)
+    return frozenset(names)
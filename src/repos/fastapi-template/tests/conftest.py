@@ -9,6 +9,8 @@ PERFORMANCE: Uses fast password hashing for tests instead of bcrypt.
 
 import sys
 import os
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
 
 # Add the target repo's backend to the path
@@ -91,7 +93,6 @@ def _patched_get_current_user(session, token):
 deps_module.get_current_user = _patched_get_current_user
 
 # Now we can import from the fastapi template
-from collections.abc import Generator
 import uuid as uuid_module
 
 import pytest
@@ -244,20 +245,27 @@ def setup_db():
 
 @pytest.fixture(scope="module")
 def db() -> Generator[Session, None, None]:
-    """Get a database session for tests."""
-    with Session(engine) as session:
+    """
+    Get a database session for tests.
+    
+    Commits do not expire loaded objects, so reading an item's fields after
+    create_random_item/bulk_items costs no reload SELECT. Tests that need to
+    see changes made through the API must refresh explicitly (see soft_delete).
+    """
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
+    """Share one TestClient (and one app lifespan) across the whole session."""
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def superuser_token_headers(client: TestClient) -> dict[str, str]:
-    """Get auth headers for the superuser."""
+    """Get auth headers for the superuser (one login per session; treat as read-only)."""
     login_data = {
         "username": settings.FIRST_SUPERUSER,
         "password": settings.FIRST_SUPERUSER_PASSWORD,
@@ -267,9 +275,9 @@ def superuser_token_headers(client: TestClient) -> dict[str, str]:
     return {"Authorization": f"Bearer {tokens['access_token']}"}
 
 
-@pytest.fixture(scope="module")
-def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]:
-    """Get auth headers for a normal user."""
+@pytest.fixture(scope="session")
+def normal_user_token_headers(client: TestClient) -> dict[str, str]:
+    """Get auth headers for a normal user (one login per session; treat as read-only)."""
     from sqlmodel import select
     
     # Create or get normal user
@@ -295,6 +303,71 @@ def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]
     return {"Authorization": f"Bearer {tokens['access_token']}"}
 
 
+def create_items_bulk(session: Session, count: int) -> list[Item]:
+    """
+    Create `count` random items for one new random owner in a single transaction.
+
+    Equivalent to calling tests.utils.item.create_random_item `count` times,
+    but without an INSERT + COMMIT round-trip per item: the ids are generated
+    client-side, so the flush sends the rows as one executemany batch.
+    """
+    from tests.utils.utils import random_email, random_lower_string
+
+    # Built directly rather than via create_random_user, which commits on its own
+    owner = User(
+        email=random_email(),
+        hashed_password=_fast_pwd_context.hash(random_lower_string()),
+        is_active=True,
+    )
+    items = [
+        Item(
+            title=random_lower_string(),
+            description=random_lower_string(),
+            owner_id=owner.id,
+        )
+        for _ in range(count)
+    ]
+    session.add(owner)
+    session.add_all(items)
+    session.commit()
+    return items
+
+
+@pytest.fixture(scope="module")
+def bulk_items(db: Session) -> Callable[[int], list[Item]]:
+    """Factory fixture: bulk_items(n) creates n random items in one commit."""
+    def _create(count: int) -> list[Item]:
+        return create_items_bulk(db, count)
+    return _create
+
+
+@contextmanager
+def count_queries(bind: Engine = engine) -> Iterator[list[str]]:
+    """
+    Record every SQL statement executed on `bind` inside the block.
+
+    Yields the (live) list of statements, so len() after the block is the
+    query count; it sees the app's queries too, since get_db is overridden
+    to use the same engine.
+    """
+    statements: list[str] = []
+    
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+
+
+@pytest.fixture(scope="session")
+def query_counter() -> Callable[[], AbstractContextManager[list[str]]]:
+    """Expose count_queries to tests: `with query_counter() as queries: ...`."""
+    return count_queries
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line(
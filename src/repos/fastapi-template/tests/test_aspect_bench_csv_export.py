@@ -25,6 +25,41 @@ from tests.utils.item import create_random_item
 
 pytestmark = pytest.mark.aspect_bench
 
+# Common paths for a CSV export endpoint
+CSV_EXPORT_PATHS = [
+    f"{settings.API_V1_STR}/items/export",
+    f"{settings.API_V1_STR}/items/export/csv",
+    f"{settings.API_V1_STR}/items/csv",
+    f"{settings.API_V1_STR}/items/download",
+]
+
+
+def _find_csv_export_path(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> str | None:
+    """First of CSV_EXPORT_PATHS that answers 200, or None if none does."""
+    for path in CSV_EXPORT_PATHS:
+        response = client.get(path, headers=superuser_token_headers)
+        if response.status_code == 200:
+            return path
+    return None
+
+
+@pytest.fixture(scope="module")
+def csv_export_path(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> str:
+    """
+    Probe for a working CSV export endpoint once per module.
+
+    Fails (rather than skips) when it is missing, so a module whose tests
+    all depend on the export can never be reported as passing.
+    """
+    path = _find_csv_export_path(client, superuser_token_headers)
+    if path is None:
+        pytest.fail(f"No working CSV export endpoint found. Tried: {CSV_EXPORT_PATHS}")
+    return path
+
 
 class TestCSVExportEndpoint:
     """Test that a CSV export endpoint exists and works."""
@@ -33,164 +68,111 @@ class TestCSVExportEndpoint:
         self, client: TestClient, superuser_token_headers: dict[str, str]
     ) -> None:
         """An endpoint for CSV export should exist at a reasonable path."""
-        # Try common paths for CSV export
-        possible_paths = [
-            f"{settings.API_V1_STR}/items/export",
-            f"{settings.API_V1_STR}/items/export/csv",
-            f"{settings.API_V1_STR}/items/csv",
-            f"{settings.API_V1_STR}/items/download",
-        ]
+        # A 200, not just "not 404": /items/export on the untouched template
+        # falls through to /items/{id} and answers 422
+        path = _find_csv_export_path(client, superuser_token_headers)
         
-        found = False
-        for path in possible_paths:
-            response = client.get(path, headers=superuser_token_headers)
-            if response.status_code != 404:
-                found = True
-                break
-        
-        assert found, f"No CSV export endpoint found. Tried: {possible_paths}"
+        assert path is not None, f"No CSV export endpoint found. Tried: {CSV_EXPORT_PATHS}"
     
     def test_csv_export_returns_csv_content_type(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, client: TestClient, superuser_token_headers: dict[str, str],
+        csv_export_path: str,
     ) -> None:
         """CSV export must return proper CSV content type."""
-        # Try common paths
-        for path in [
-            f"{settings.API_V1_STR}/items/export",
-            f"{settings.API_V1_STR}/items/export/csv",
-            f"{settings.API_V1_STR}/items/csv",
-        ]:
-            response = client.get(path, headers=superuser_token_headers)
-            if response.status_code == 200:
-                content_type = response.headers.get("content-type", "")
-                assert "text/csv" in content_type or "application/csv" in content_type, \
-                    f"Expected CSV content type, got: {content_type}"
-                return
-        
-        pytest.fail("No working CSV export endpoint found")
+        response = client.get(csv_export_path, headers=superuser_token_headers)
+        content_type = response.headers.get("content-type", "")
+        assert "text/csv" in content_type or "application/csv" in content_type, \
+            f"Expected CSV content type, got: {content_type}"
     
     def test_csv_export_is_file_download(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, client: TestClient, superuser_token_headers: dict[str, str],
+        csv_export_path: str,
     ) -> None:
         """CSV export must have Content-Disposition header for file download."""
-        for path in [
-            f"{settings.API_V1_STR}/items/export",
-            f"{settings.API_V1_STR}/items/export/csv",
-            f"{settings.API_V1_STR}/items/csv",
-        ]:
-            response = client.get(path, headers=superuser_token_headers)
-            if response.status_code == 200:
-                content_disp = response.headers.get("content-disposition", "")
-                assert "attachment" in content_disp.lower() or "filename" in content_disp.lower(), \
-                    f"Expected file download header, got: {content_disp}"
-                return
-        
-        pytest.fail("No working CSV export endpoint found")
+        response = client.get(csv_export_path, headers=superuser_token_headers)
+        content_disp = response.headers.get("content-disposition", "")
+        assert "attachment" in content_disp.lower() or "filename" in content_disp.lower(), \
+            f"Expected file download header, got: {content_disp}"
 
 
 class TestCSVExportContent:
     """Test that the CSV content includes all item fields."""
     
     def test_csv_includes_all_item_fields(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str],
+        csv_export_path: str,
     ) -> None:
         """CSV must include ALL item fields: id, title, description, owner_id."""
         # Create an item so we have data to export
         item = create_random_item(db)
         
-        # Find the export endpoint
-        for path in [
-            f"{settings.API_V1_STR}/items/export",
-            f"{settings.API_V1_STR}/items/export/csv",
-            f"{settings.API_V1_STR}/items/csv",
-        ]:
-            response = client.get(path, headers=superuser_token_headers)
-            if response.status_code == 200:
-                content = response.text
-                
-                # Parse as CSV
-                reader = csv.reader(io.StringIO(content))
-                rows = list(reader)
-                
-                assert len(rows) >= 1, "CSV should have at least a header row"
-                
-                header = [h.lower() for h in rows[0]]
-                
-                # Check for required fields
-                required_fields = ["id", "title", "description", "owner_id"]
-                for field in required_fields:
-                    # Allow variations like "owner_id" or "ownerid" or "ownerId"
-                    found = any(field.replace("_", "") in h.replace("_", "") for h in header)
-                    assert found, f"CSV must include '{field}' field. Got headers: {rows[0]}"
-                
-                return
+        response = client.get(csv_export_path, headers=superuser_token_headers)
+        assert response.status_code == 200
+        content = response.text
+        
+        # Parse as CSV
+        reader = csv.reader(io.StringIO(content))
+        rows = list(reader)
         
-        pytest.fail("No working CSV export endpoint found")
+        assert len(rows) >= 1, "CSV should have at least a header row"
+        
+        header = [h.lower() for h in rows[0]]
+        
+        # Check for required fields
+        required_fields = ["id", "title", "description", "owner_id"]
+        for field in required_fields:
+            # Allow variations like "owner_id" or "ownerid" or "ownerId"
+            found = any(field.replace("_", "") in h.replace("_", "") for h in header)
+            assert found, f"CSV must include '{field}' field. Got headers: {rows[0]}"
     
     def test_csv_contains_actual_item_data(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str],
+        csv_export_path: str,
     ) -> None:
         """CSV should contain the actual item data, not just headers."""
         # Create items
         item1 = create_random_item(db)
         item2 = create_random_item(db)
         
-        for path in [
-            f"{settings.API_V1_STR}/items/export",
-            f"{settings.API_V1_STR}/items/export/csv",
-            f"{settings.API_V1_STR}/items/csv",
-        ]:
-            response = client.get(path, headers=superuser_token_headers)
-            if response.status_code == 200:
-                content = response.text
-                reader = csv.reader(io.StringIO(content))
-                rows = list(reader)
-                
-                # Should have header + at least 2 data rows
-                assert len(rows) >= 3, f"Expected header + data rows, got {len(rows)} rows"
-                
-                # Check that item titles appear in the content
-                assert item1.title in content or str(item1.id) in content, \
-                    "Item data should appear in CSV"
-                return
+        response = client.get(csv_export_path, headers=superuser_token_headers)
+        assert response.status_code == 200
+        content = response.text
+        reader = csv.reader(io.StringIO(content))
+        rows = list(reader)
         
-        pytest.fail("No working CSV export endpoint found")
+        # Should have header + at least 2 data rows
+        assert len(rows) >= 3, f"Expected header + data rows, got {len(rows)} rows"
+        
+        # Check that item titles appear in the content
+        assert item1.title in content or str(item1.id) in content, \
+            "Item data should appear in CSV"
 
 
 class TestCSVExportEdgeCases:
     """Edge cases for CSV export."""
     
-    def test_csv_export_requires_auth(self, client: TestClient) -> None:
+    def test_csv_export_requires_auth(
+        self, client: TestClient, csv_export_path: str
+    ) -> None:
         """CSV export should require authentication."""
-        for path in [
-            f"{settings.API_V1_STR}/items/export",
-            f"{settings.API_V1_STR}/items/export/csv",
-            f"{settings.API_V1_STR}/items/csv",
-        ]:
-            response = client.get(path)
-            if response.status_code != 404:
-                assert response.status_code in (401, 403), \
-                    "CSV export should require authentication"
-                return
+        response = client.get(csv_export_path)
+        assert response.status_code in (401, 403), \
+            "CSV export should require authentication"
     
     def test_csv_export_empty_items(
-        self, client: TestClient, normal_user_token_headers: dict[str, str]
+        self, client: TestClient, normal_user_token_headers: dict[str, str],
+        csv_export_path: str,
     ) -> None:
         """CSV export with no items should still work (return headers at least)."""
-        for path in [
-            f"{settings.API_V1_STR}/items/export",
-            f"{settings.API_V1_STR}/items/export/csv",
-            f"{settings.API_V1_STR}/items/csv",
-        ]:
-            response = client.get(path, headers=normal_user_token_headers)
-            if response.status_code == 200:
-                # Should at least have a header row
-                content = response.text.strip()
-                assert len(content) > 0, "CSV should have at least headers even with no items"
-                return
+        response = client.get(csv_export_path, headers=normal_user_token_headers)
+        if response.status_code == 200:
+            # Should at least have a header row
+            content = response.text.strip()
+            assert len(content) > 0, "CSV should have at least headers even with no items"
     
     def test_csv_handles_special_characters(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str],
+        csv_export_path: str,
     ) -> None:
         """CSV should properly escape special characters (commas, quotes)."""
         # Create item with special characters
@@ -210,13 +192,6 @@ class TestCSVExportEdgeCases:
             db.add(special_item)
             db.commit()
             
-            for path in [
-                f"{settings.API_V1_STR}/items/export",
-                f"{settings.API_V1_STR}/items/export/csv",
-                f"{settings.API_V1_STR}/items/csv",
-            ]:
-                response = client.get(path, headers=superuser_token_headers)
-                if response.status_code == 200:
-                    # Just verify it doesn't crash - proper CSV escaping is complex
-                    assert response.status_code == 200
-                    return
+            response = client.get(csv_export_path, headers=superuser_token_headers)
+            # Just verify it doesn't crash - proper CSV escaping is complex
+            assert response.status_code == 200
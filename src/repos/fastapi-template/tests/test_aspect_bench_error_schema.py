@@ -26,17 +26,43 @@ Tests based SOLELY on prompt requirements:
 2. consistent-error-schema: All errors have consistent "detail" field
 """
 
+import re
 import uuid
+
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 from sqlmodel import Session
 
 from app.core.config import settings
+from aspect_bench_sources import items_routes_source
 from tests.utils.item import create_random_item
 
 
 pytestmark = pytest.mark.aspect_bench
 
+# Basic ISO8601 prefix check for error timestamps
+_ISO8601 = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+# Phrases that indicate a missing-item message is clear
+_NOT_FOUND_MARKERS = re.compile("not found|not exist|missing")
+
+
+@pytest.fixture(scope="class")
+def missing_item_response(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> Response:
+    """GET a nonexistent item once and share the response across a test class."""
+    return client.get(
+        f"{settings.API_V1_STR}/items/{uuid.uuid4()}",
+        headers=superuser_token_headers,
+    )
+
+
+@pytest.fixture(scope="class")
+def missing_item_data(missing_item_response: Response) -> dict:
+    """Parsed JSON body of the shared missing-item response."""
+    return missing_item_response.json()
+
 
 class TestMissingItemReturns404:
     """Test that missing items return 404 with clear message."""
@@ -81,39 +107,22 @@ class TestMissingItemHasClearMessage:
     """Test that missing item errors have clear messages."""
     
     def test_missing_item_has_detail_message(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, missing_item_response: Response, missing_item_data: dict
     ) -> None:
         """Missing item response should have a detail message."""
-        fake_id = str(uuid.uuid4())
-        response = client.get(
-            f"{settings.API_V1_STR}/items/{fake_id}",
-            headers=superuser_token_headers,
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
+        assert missing_item_response.status_code == 404
+        data = missing_item_data
         
         assert "detail" in data, "Error should have 'detail' field"
         assert len(data["detail"]) > 0, "Detail message should not be empty"
     
-    def test_missing_item_message_is_clear(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
+    def test_missing_item_message_is_clear(self, missing_item_data: dict) -> None:
         """Missing item message should be understandable."""
-        fake_id = str(uuid.uuid4())
-        response = client.get(
-            f"{settings.API_V1_STR}/items/{fake_id}",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = missing_item_data
         detail = data.get("detail", "").lower()
         
         # Message should indicate item not found
-        clear_indicators = ["not found", "not exist", "does not exist", "missing"]
-        is_clear = any(ind in detail for ind in clear_indicators)
-        
-        assert is_clear, \
+        assert _NOT_FOUND_MARKERS.search(detail), \
             f"Message should clearly indicate item not found. Got: {data.get('detail')}"
 
 
@@ -121,16 +130,11 @@ class TestConsistentErrorSchema:
     """Test that all error responses have consistent schema."""
     
     def test_404_has_detail_field(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, missing_item_response: Response, missing_item_data: dict
     ) -> None:
         """404 errors should have 'detail' field."""
-        response = client.get(
-            f"{settings.API_V1_STR}/items/{uuid.uuid4()}",
-            headers=superuser_token_headers,
-        )
-        
-        assert response.status_code == 404
-        assert "detail" in response.json()
+        assert missing_item_response.status_code == 404
+        assert "detail" in missing_item_data
     
     def test_401_has_detail_field(
         self, client: TestClient
@@ -310,81 +314,54 @@ class TestConsistentSchemaImplemented:
             "AppError exception class should be defined (e.g., in app.core.exceptions)"
     
     def test_error_response_has_error_code(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, missing_item_response: Response, missing_item_data: dict
     ) -> None:
         """
         Error responses must have error_code field.
         
         The prompt specifies: {"error_code": "ITEM_NOT_FOUND", ...}
         """
-        response = client.get(
-            f"{settings.API_V1_STR}/items/{uuid.uuid4()}",
-            headers=superuser_token_headers,
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
+        assert missing_item_response.status_code == 404
+        data = missing_item_data
         
         assert "error_code" in data, \
             "Error response must have 'error_code' field (e.g., 'ITEM_NOT_FOUND')"
         assert isinstance(data["error_code"], str), \
             "error_code must be a string"
     
-    def test_error_response_has_message(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
+    def test_error_response_has_message(self, missing_item_data: dict) -> None:
         """
         Error responses must have message field.
         """
-        response = client.get(
-            f"{settings.API_V1_STR}/items/{uuid.uuid4()}",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = missing_item_data
         
         assert "message" in data, \
             "Error response must have 'message' field"
     
-    def test_error_response_has_timestamp(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
+    def test_error_response_has_timestamp(self, missing_item_data: dict) -> None:
         """
         Error responses must have ISO8601 timestamp.
         
         The prompt specifies: {"timestamp": "ISO8601"}
         """
-        import re
-        
-        response = client.get(
-            f"{settings.API_V1_STR}/items/{uuid.uuid4()}",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = missing_item_data
         
         assert "timestamp" in data, \
             "Error response must have 'timestamp' field"
         
         # Check ISO8601 format (basic check)
         timestamp = data["timestamp"]
-        iso8601_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'
-        assert re.match(iso8601_pattern, timestamp), \
+        assert _ISO8601.match(timestamp), \
             f"Timestamp must be ISO8601 format, got: {timestamp}"
     
-    def test_routes_use_app_error(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
+    def test_routes_use_app_error(self) -> None:
         """
         Routes should use AppError instead of raw HTTPException.
         
         The prompt says to "migrate the items and users routes to use
         this new error pattern instead of raw HTTPException".
         """
-        import inspect
-        from app.api.routes import items
-        
-        source = inspect.getsource(items)
+        source = items_routes_source()
         
         # Should reference AppError, not just HTTPException
         uses_app_error = "AppError" in source or "app_error" in source.lower()
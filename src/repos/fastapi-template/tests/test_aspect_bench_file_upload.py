@@ -14,35 +14,81 @@ Tests based SOLELY on prompt requirements:
 5. Returns attachment metadata
 """
 
+import functools
+
+import httpx
 import pytest
-import io
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.config import settings
+from app.models import Item
 from tests.utils.item import create_random_item
 
 
 pytestmark = pytest.mark.aspect_bench
 
+_ITEMS_URL = f"{settings.API_V1_STR}/items"
+
+# Shared 1KB binary payload
+_PAYLOAD_1K = b"x" * 1024
+# Accepted names for the file size in the upload response, in priority order
+_SIZE_KEYS = ("size", "file_size", "bytes")
+# Declared size for the over-limit probe (limit is 100MB); no body is sent
+_OVERSIZED_CONTENT_LENGTH = 200 * 1024 * 1024
+
+
+@functools.cache
+def _attachment_fields() -> frozenset[str]:
+    """
+    Field names of app.models.Attachment, resolved once.
+
+    Falls back to public class attributes for models without Pydantic model_fields.
+    Raises ImportError if the model does not exist.
+    """
+    from app.models import Attachment
+    
+    fields = getattr(Attachment, "model_fields", None)
+    if fields is None:
+        return frozenset(name for name in dir(Attachment) if not name.startswith("_"))
+    return frozenset(fields)
+
+
+@functools.cache
+def _multipart_body(filename: str, content: bytes, content_type: str) -> tuple[bytes, str]:
+    """
+    Encode a single-file multipart upload once per distinct file.
+
+    Returns the request body and its Content-Type header (which carries the boundary),
+    for use as client.post(url, content=body, headers={"Content-Type": content_type}).
+    """
+    request = httpx.Request(
+        "POST", "http://testserver", files={"file": (filename, content, content_type)}
+    )
+    return request.read(), request.headers["Content-Type"]
+
+
+@pytest.fixture(scope="module")
+def shared_item(db: Session) -> Item:
+    """One existing item to upload attachments to; the tests only need a valid item_id."""
+    return create_random_item(db)
+
 
 class TestUploadEndpointExists:
     """Test that upload endpoint exists."""
     
     def test_upload_endpoint_exists(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, shared_item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Upload endpoint should exist."""
-        item = create_random_item(db)
-        
         # Create a small test file
         file_content = b"test file content"
-        files = {"file": ("test.txt", io.BytesIO(file_content), "text/plain")}
+        body, content_type = _multipart_body("test.txt", file_content, "text/plain")
         
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item.id}/attachments",
-            headers=superuser_token_headers,
-            files=files,
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
+            headers={**superuser_token_headers, "Content-Type": content_type},
+            content=body,
         )
         
         # Should not be 404 or 405
@@ -50,18 +96,16 @@ class TestUploadEndpointExists:
             "POST /api/v1/items/{item_id}/attachments must exist"
     
     def test_accepts_multipart_form(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, shared_item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Endpoint should accept multipart/form-data."""
-        item = create_random_item(db)
-        
         file_content = b"test content for upload"
-        files = {"file": ("document.txt", io.BytesIO(file_content), "text/plain")}
+        body, content_type = _multipart_body("document.txt", file_content, "text/plain")
         
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item_id}/attachments",
-            headers=superuser_token_headers,
-            files=files,
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
+            headers={**superuser_token_headers, "Content-Type": content_type},
+            content=body,
         )
         
         # Should accept the upload (200, 201, or 422 for validation)
@@ -72,36 +116,32 @@ class TestFileUpload:
     """Test file upload functionality."""
     
     def test_can_upload_file(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, shared_item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Should be able to upload a file."""
-        item = create_random_item(db)
-        
         file_content = b"Hello, this is a test file for upload."
-        files = {"file": ("hello.txt", io.BytesIO(file_content), "text/plain")}
+        body, content_type = _multipart_body("hello.txt", file_content, "text/plain")
         
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item.id}/attachments",
-            headers=superuser_token_headers,
-            files=files,
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
+            headers={**superuser_token_headers, "Content-Type": content_type},
+            content=body,
         )
         
         assert response.status_code in (200, 201), \
             f"Upload should succeed, got {response.status_code}"
     
     def test_upload_returns_attachment_info(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, shared_item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Upload should return attachment metadata."""
-        item = create_random_item(db)
-        
         file_content = b"Test content for metadata"
-        files = {"file": ("metadata_test.txt", io.BytesIO(file_content), "text/plain")}
+        body, content_type = _multipart_body("metadata_test.txt", file_content, "text/plain")
         
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item.id}/attachments",
-            headers=superuser_token_headers,
-            files=files,
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
+            headers={**superuser_token_headers, "Content-Type": content_type},
+            content=body,
         )
         
         if response.status_code in (200, 201):
@@ -112,27 +152,26 @@ class TestFileUpload:
                 "Response should include attachment info"
     
     def test_upload_returns_file_size(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, shared_item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Upload should return file size."""
-        item = create_random_item(db)
-        
-        file_content = b"x" * 1000  # 1KB file
-        files = {"file": ("size_test.bin", io.BytesIO(file_content), "application/octet-stream")}
+        file_content = _PAYLOAD_1K
+        body, content_type = _multipart_body("size_test.bin", file_content, "application/octet-stream")
         
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item.id}/attachments",
-            headers=superuser_token_headers,
-            files=files,
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
+            headers={**superuser_token_headers, "Content-Type": content_type},
+            content=body,
         )
         
         if response.status_code in (200, 201):
             data = response.json()
             
-            assert "size" in data or "file_size" in data or "bytes" in data, \
+            size_key = next((key for key in _SIZE_KEYS if key in data), None)
+            assert size_key is not None, \
                 "Response should include file size"
             
-            size = data.get("size") or data.get("file_size") or data.get("bytes")
+            size = data[size_key]
             assert size >= 1000, "File size should match uploaded content"
 
 
@@ -140,44 +179,41 @@ class TestFileSizeLimit:
     """Test file size limit enforcement."""
     
     def test_small_file_accepted(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, shared_item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Small files should be accepted."""
-        item = create_random_item(db)
-        
         file_content = b"Small file content"
-        files = {"file": ("small.txt", io.BytesIO(file_content), "text/plain")}
+        body, content_type = _multipart_body("small.txt", file_content, "text/plain")
         
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item.id}/attachments",
-            headers=superuser_token_headers,
-            files=files,
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
+            headers={**superuser_token_headers, "Content-Type": content_type},
+            content=body,
         )
         
         assert response.status_code in (200, 201)
     
     def test_too_large_file_rejected(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, shared_item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Files over 100MB should be rejected."""
-        item = create_random_item(db)
-        
         # Note: We won't actually create a 100MB file in tests
         # Instead we'll check that there's size validation logic
         # by trying with a header that claims a large size
-        
-        # Create a 1KB file but we'll test the limit exists
-        file_content = b"x" * 1024
-        files = {"file": ("large.bin", io.BytesIO(file_content), "application/octet-stream")}
-        
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item.id}/attachments",
-            headers=superuser_token_headers,
-            files=files,
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
+            headers={
+                **superuser_token_headers,
+                "Content-Length": str(_OVERSIZED_CONTENT_LENGTH),
+                "Content-Type": "multipart/form-data; boundary=aspect-bench",
+            },
+            content=b"",
         )
         
-        # The small file should work; we're just verifying the endpoint accepts uploads
-        assert response.status_code in (200, 201, 413, 422)
+        # Early-reject on the declared size (413); an implementation that counts
+        # streamed bytes instead sees an empty multipart body and answers 422
+        assert response.status_code in (413, 422), \
+            f"Oversized upload should be rejected, got {response.status_code}"
 
 
 class TestAttachmentModel:
@@ -194,70 +230,57 @@ class TestAttachmentModel:
     def test_attachment_has_item_link(self) -> None:
         """Attachment should have item_id field."""
         try:
-            from app.models import Attachment
-            
-            # Check for item_id field
-            fields = Attachment.model_fields if hasattr(Attachment, 'model_fields') else {}
-            
-            assert "item_id" in fields or hasattr(Attachment, 'item_id'), \
-                "Attachment must have item_id linking to Item"
+            fields = _attachment_fields()
         except ImportError:
             pytest.fail("Attachment model must exist in app.models")
+        
+        assert "item_id" in fields, \
+            "Attachment must have item_id linking to Item"
     
     def test_attachment_has_required_fields(self) -> None:
         """Attachment should have required fields."""
         try:
-            from app.models import Attachment
-            
-            fields = Attachment.model_fields if hasattr(Attachment, 'model_fields') else {}
-            field_names = set(fields.keys())
-            
-            # Should have at least filename and size
-            has_filename = "filename" in field_names or "file_name" in field_names or "name" in field_names
-            has_size = "size" in field_names or "file_size" in field_names
-            
-            assert has_filename, "Attachment must have filename field"
-            assert has_size, "Attachment must have size field"
+            field_names = _attachment_fields()
         except ImportError:
             pytest.fail("Attachment model must exist in app.models")
+        
+        # Should have at least filename and size
+        has_filename = "filename" in field_names or "file_name" in field_names or "name" in field_names
+        has_size = "size" in field_names or "file_size" in field_names
+        
+        assert has_filename, "Attachment must have filename field"
+        assert has_size, "Attachment must have size field"
 
 
 class TestUploadAuth:
     """Test upload authentication."""
     
     def test_requires_auth(
-        self, client: TestClient, db: Session
+        self, client: TestClient, shared_item: Item
     ) -> None:
         """Upload should require authentication."""
-        item = create_random_item(db)
-        
         file_content = b"test"
-        files = {"file": ("test.txt", io.BytesIO(file_content), "text/plain")}
+        body, content_type = _multipart_body("test.txt", file_content, "text/plain")
         
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item.id}/attachments",
-            files=files,
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
+            headers={"Content-Type": content_type},
+            content=body,
         )
         
         assert response.status_code in (401, 403)
     
     def test_user_can_upload_to_own_item(
-        self, client: TestClient, db: Session, normal_user_token_headers: dict[str, str]
+        self, client: TestClient, normal_user_token_headers: dict[str, str]
     ) -> None:
         """User should be able to upload to their own item."""
-        # Create item owned by normal user
-        from sqlmodel import select
-        from app.models import User
-        
-        # Get normal user
-        email = settings.EMAIL_TEST_USER
-        
         # This test just verifies the endpoint accepts auth
         # The actual ownership check depends on implementation
+        body, content_type = _multipart_body("test.txt", b"test", "text/plain")
         response = client.post(
-            f"{settings.API_V1_STR}/items/999/attachments",  # May not exist
-            headers=normal_user_token_headers,
-            files={"file": ("test.txt", io.BytesIO(b"test"), "text/plain")},
+            f"{_ITEMS_URL}/999/attachments",  # May not exist
+            headers={**normal_user_token_headers, "Content-Type": content_type},
+            content=body,
         )
         
         # Should get auth error (401/403) or not found (404) but not method not allowed
@@ -268,13 +291,11 @@ class TestUploadEdgeCases:
     """Test edge cases for file upload."""
     
     def test_missing_file_rejected(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, shared_item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Request without file should be rejected."""
-        item = create_random_item(db)
-        
         response = client.post(
-            f"{settings.API_V1_STR}/items/{item.id}/attachments",
+            f"{_ITEMS_URL}/{shared_item.id}/attachments",
             headers=superuser_token_headers,
         )
         
@@ -286,12 +307,12 @@ class TestUploadEdgeCases:
     ) -> None:
         """Upload to nonexistent item should return 404."""
         file_content = b"test"
-        files = {"file": ("test.txt", io.BytesIO(file_content), "text/plain")}
+        body, content_type = _multipart_body("test.txt", file_content, "text/plain")
         
         response = client.post(
-            f"{settings.API_V1_STR}/items/00000000-0000-0000-0000-000000000000/attachments",
-            headers=superuser_token_headers,
-            files=files,
+            f"{_ITEMS_URL}/00000000-0000-0000-0000-000000000000/attachments",
+            headers={**superuser_token_headers, "Content-Type": content_type},
+            content=body,
         )
         
         assert response.status_code == 404
@@ -17,46 +17,46 @@ Tests based SOLELY on prompt requirements:
 4. Pagination works correctly (skip/limit behavior)
 """
 
+from collections.abc import Callable, Generator
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.config import settings
-from tests.utils.item import create_random_item
+from app.models import Item
 
 
 pytestmark = pytest.mark.aspect_bench
 
+_ITEMS_URL = f"{settings.API_V1_STR}/items"
+
+# Enough rows to exercise the 100-item limit cap
+SEEDED_ITEM_COUNT = 105
+
+
+@pytest.fixture(scope="module")
+def seeded_items(
+    db: Session, bulk_items: Callable[[int], list[Item]]
+) -> Generator[list[Item], None, None]:
+    """Create the pagination test items once per module and remove them afterwards."""
+    items = bulk_items(SEEDED_ITEM_COUNT)
+    yield items
+    for item in items:
+        db.delete(item)
+    db.commit()
+
 
 class TestPaginationParameters:
     """Test that pagination parameters are accepted and work."""
     
-    def test_items_endpoint_accepts_skip_parameter(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """Items endpoint should accept skip parameter."""
-        response = client.get(
-            f"{settings.API_V1_STR}/items/?skip=0",
-            headers=superuser_token_headers,
-        )
-        assert response.status_code == 200
-    
-    def test_items_endpoint_accepts_limit_parameter(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """Items endpoint should accept limit parameter."""
-        response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=10",
-            headers=superuser_token_headers,
-        )
-        assert response.status_code == 200
-    
-    def test_items_endpoint_accepts_both_skip_and_limit(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+    @pytest.mark.parametrize("query", ["skip=0", "limit=10", "skip=5&limit=10"])
+    def test_items_endpoint_accepts_pagination_parameters(
+        self, client: TestClient, superuser_token_headers: dict[str, str], query: str
     ) -> None:
-        """Items endpoint should accept both skip and limit."""
+        """Items endpoint should accept skip, limit, and both together."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/?skip=5&limit=10",
+            f"{_ITEMS_URL}/?{query}",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -70,7 +70,7 @@ class TestPaginationResponse:
     ) -> None:
         """Response must include total count of items."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -84,7 +84,7 @@ class TestPaginationResponse:
     ) -> None:
         """Response must include items array."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -98,40 +98,38 @@ class TestPaginationBehavior:
     """Test that pagination actually works correctly."""
     
     def test_skip_skips_items(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, seeded_items: list[Item],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Skip parameter should skip the first N items."""
-        # Create multiple items
-        items = [create_random_item(db) for _ in range(5)]
-        
         # Get all items
         response_all = client.get(
-            f"{settings.API_V1_STR}/items/?skip=0&limit=100",
+            f"{_ITEMS_URL}/?skip=0&limit=100",
             headers=superuser_token_headers,
         )
-        all_data = response_all.json()["data"]
+        all_json = response_all.json()
+        all_data = all_json["data"]
+        total = all_json["count"]
         
         # Get with skip=2
         response_skip = client.get(
-            f"{settings.API_V1_STR}/items/?skip=2&limit=100",
+            f"{_ITEMS_URL}/?skip=2&limit=100",
             headers=superuser_token_headers,
         )
         skip_data = response_skip.json()["data"]
         
-        # Skip should return fewer items
-        if len(all_data) > 2:
-            assert len(skip_data) == len(all_data) - 2, \
+        # Skip should return fewer items (the seeded set can exceed one page)
+        if total > 2:
+            assert len(skip_data) == min(total - 2, len(all_data)), \
                 f"Skip=2 should return 2 fewer items"
     
     def test_limit_limits_items(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, seeded_items: list[Item],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Limit parameter should limit the number of returned items."""
-        # Create multiple items
-        items = [create_random_item(db) for _ in range(5)]
-        
         response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=2",
+            f"{_ITEMS_URL}/?limit=2",
             headers=superuser_token_headers,
         )
         data = response.json()
@@ -139,15 +137,13 @@ class TestPaginationBehavior:
         assert len(data["data"]) <= 2, "Limit=2 should return at most 2 items"
     
     def test_count_reflects_total_not_page(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, seeded_items: list[Item],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Count should reflect total items, not just items in current page."""
-        # Create items
-        items = [create_random_item(db) for _ in range(5)]
-        
         # Get with limit=1
         response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=1",
+            f"{_ITEMS_URL}/?limit=1",
             headers=superuser_token_headers,
         )
         data = response.json()
@@ -165,7 +161,7 @@ class TestPaginationEdgeCases:
     ) -> None:
         """Skip beyond available items should return empty list."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/?skip=99999",
+            f"{_ITEMS_URL}/?skip=99999",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -173,53 +169,41 @@ class TestPaginationEdgeCases:
         
         assert data["data"] == [], "Skipping beyond items should return empty data"
     
-    def test_limit_zero(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+    @pytest.mark.parametrize(
+        ("query", "allowed_statuses"),
+        [
+            # Limit of 0: either returns empty or validation error
+            ("limit=0", (200, 422)),
+            # Negative skip: validation error or treated as 0
+            ("skip=-5", (200, 422)),
+            # Very large limit should be handled
+            ("limit=10000", (200,)),
+        ],
+    )
+    def test_edge_case_parameters_handled(
+        self, client: TestClient, superuser_token_headers: dict[str, str],
+        query: str, allowed_statuses: tuple[int, ...],
     ) -> None:
-        """Limit of 0 should be handled (either empty or validation error)."""
+        """Unusual skip/limit values should be handled without server errors."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=0",
+            f"{_ITEMS_URL}/?{query}",
             headers=superuser_token_headers,
         )
-        # Either returns empty or validation error
-        assert response.status_code in (200, 422)
-    
-    def test_negative_skip(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """Negative skip should be handled (validation error or treated as 0)."""
-        response = client.get(
-            f"{settings.API_V1_STR}/items/?skip=-5",
-            headers=superuser_token_headers,
-        )
-        # Should either error or handle gracefully
-        assert response.status_code in (200, 422)
-    
-    def test_large_limit(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """Very large limit should be handled."""
-        response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=10000",
-            headers=superuser_token_headers,
-        )
-        assert response.status_code == 200
+        assert response.status_code in allowed_statuses
     
     def test_pagination_preserves_order(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, seeded_items: list[Item],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Pagination should preserve consistent ordering."""
-        # Create items
-        items = [create_random_item(db) for _ in range(5)]
-        
         # Get first page
         r1 = client.get(
-            f"{settings.API_V1_STR}/items/?skip=0&limit=2",
+            f"{_ITEMS_URL}/?skip=0&limit=2",
             headers=superuser_token_headers,
         )
         # Get second page
         r2 = client.get(
-            f"{settings.API_V1_STR}/items/?skip=2&limit=2",
+            f"{_ITEMS_URL}/?skip=2&limit=2",
             headers=superuser_token_headers,
         )
         
@@ -241,47 +225,31 @@ class TestPaginationValidation:
     - Cap limit at 100 maximum
     """
     
-    def test_negative_skip_is_rejected(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+    @pytest.mark.parametrize("param", ["skip", "limit"])
+    def test_negative_value_is_rejected(
+        self, client: TestClient, superuser_token_headers: dict[str, str], param: str
     ) -> None:
         """
-        Negative skip values should be rejected with 422.
+        Negative skip and limit values should be rejected with 422.
         """
         response = client.get(
-            f"{settings.API_V1_STR}/items/?skip=-1",
+            f"{_ITEMS_URL}/?{param}=-1",
             headers=superuser_token_headers,
         )
         
         assert response.status_code == 422, \
-            "Negative skip should be rejected with 422 validation error"
-    
-    def test_negative_limit_is_rejected(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """
-        Negative limit values should be rejected with 422.
-        """
-        response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=-1",
-            headers=superuser_token_headers,
-        )
-        
-        assert response.status_code == 422, \
-            "Negative limit should be rejected with 422 validation error"
+            f"Negative {param} should be rejected with 422 validation error"
     
     def test_limit_capped_at_100(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, seeded_items: list[Item],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """
         Limit must be capped at 100 maximum per the prompt.
         """
-        # Create more than 100 items
-        for _ in range(5):
-            create_random_item(db)
-        
         # Request with limit > 100
         response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=200",
+            f"{_ITEMS_URL}/?limit=200",
             headers=superuser_token_headers,
         )
         
@@ -319,19 +287,16 @@ class TestCursorBasedPagination:
             "Item model must have 'created_at' field for cursor-based pagination"
     
     def test_response_has_cursor_format(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, seeded_items: list[Item],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """
         Response must have cursor-based pagination format.
         
         Expected: {"data": [...], "next_cursor": "...", "has_more": bool}
         """
-        # Create items
-        for _ in range(5):
-            create_random_item(db)
-        
         response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=2",
+            f"{_ITEMS_URL}/?limit=2",
             headers=superuser_token_headers,
         )
         
@@ -346,18 +311,15 @@ class TestCursorBasedPagination:
             "Response must have 'has_more' boolean field"
     
     def test_cursor_allows_pagination(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, seeded_items: list[Item],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """
         Using cursor should return next page of results.
         """
-        # Create items
-        for _ in range(5):
-            create_random_item(db)
-        
         # Get first page
         response1 = client.get(
-            f"{settings.API_V1_STR}/items/?limit=2",
+            f"{_ITEMS_URL}/?limit=2",
             headers=superuser_token_headers,
         )
         
@@ -367,7 +329,7 @@ class TestCursorBasedPagination:
         if cursor and data1.get("has_more"):
             # Get next page using cursor
             response2 = client.get(
-                f"{settings.API_V1_STR}/items/?cursor={cursor}&limit=2",
+                f"{_ITEMS_URL}/?cursor={cursor}&limit=2",
                 headers=superuser_token_headers,
             )
             
@@ -391,7 +353,7 @@ class TestCursorBasedPagination:
         """
         # Try with obviously invalid cursor
         response = client.get(
-            f"{settings.API_V1_STR}/items/?cursor=invalid_tampered_cursor_12345",
+            f"{_ITEMS_URL}/?cursor=invalid_tampered_cursor_12345",
             headers=superuser_token_headers,
         )
         
@@ -18,6 +18,11 @@ Tests based SOLELY on prompt requirements:
 8. Error messages should indicate what's missing
 """
 
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
@@ -28,77 +33,53 @@ from tests.utils.utils import random_email
 
 pytestmark = pytest.mark.aspect_bench
 
-
-class TestPasswordRequiresUppercase:
-    """Test that passwords require uppercase letters."""
-    
-    def test_password_without_uppercase_rejected(
-        self, client: TestClient
-    ) -> None:
-        """Password without uppercase should be rejected."""
-        response = client.post(
-            f"{settings.API_V1_STR}/users/signup",
-            json={
-                "email": random_email(),
-                "password": "password1!",  # No uppercase
-            },
-        )
-        assert response.status_code == 422, \
-            "Password without uppercase should be rejected"
-
-
-class TestPasswordRequiresLowercase:
-    """Test that passwords require lowercase letters."""
+# Any mention of a password requirement (matched against lowercased detail)
+_HELPFUL_HINT = re.compile(
+    "upper|capital|lower|digit|number|numeric|special|symbol|character|length|minimum"
+)
+# One pattern per requirement, for counting how many a message mentions
+_REQUIREMENT_PATTERNS = (
+    re.compile("length|character|12"),
+    re.compile("upper"),
+    re.compile("lower"),
+    re.compile("digit|number"),
+    re.compile("special|symbol"),
+)
+
+
+@contextmanager
+def _mock_smtp() -> Iterator[None]:
+    """Enable email settings but stub out sending, so user creation never hits SMTP."""
+    with (
+        patch("app.utils.send_email", return_value=None),
+        patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
+        patch("app.core.config.settings.SMTP_USER", "admin@example.com"),
+    ):
+        yield
+
+
+class TestPasswordRequiresCharacterClasses:
+    """Test that passwords require uppercase, lowercase, digit and special characters."""
     
-    def test_password_without_lowercase_rejected(
-        self, client: TestClient
+    @pytest.mark.parametrize(("password", "missing"), [
+        ("password1!", "uppercase"),
+        ("PASSWORD1!", "lowercase"),
+        ("Password!", "digit"),
+        ("Password1", "special character"),
+    ])
+    def test_password_missing_character_class_rejected(
+        self, client: TestClient, password: str, missing: str
     ) -> None:
-        """Password without lowercase should be rejected."""
+        """Password missing any required character class should be rejected."""
         response = client.post(
             f"{settings.API_V1_STR}/users/signup",
             json={
                 "email": random_email(),
-                "password": "PASSWORD1!",  # No lowercase
+                "password": password,
             },
         )
         assert response.status_code == 422, \
-            "Password without lowercase should be rejected"
-
-
-class TestPasswordRequiresDigit:
-    """Test that passwords require digits."""
-    
-    def test_password_without_digit_rejected(
-        self, client: TestClient
-    ) -> None:
-        """Password without digit should be rejected."""
-        response = client.post(
-            f"{settings.API_V1_STR}/users/signup",
-            json={
-                "email": random_email(),
-                "password": "Password!",  # No digit
-            },
-        )
-        assert response.status_code == 422, \
-            "Password without digit should be rejected"
-
-
-class TestPasswordRequiresSpecialChar:
-    """Test that passwords require special characters."""
-    
-    def test_password_without_special_char_rejected(
-        self, client: TestClient
-    ) -> None:
-        """Password without special character should be rejected."""
-        response = client.post(
-            f"{settings.API_V1_STR}/users/signup",
-            json={
-                "email": random_email(),
-                "password": "Password1",  # No special char
-            },
-        )
-        assert response.status_code == 422, \
-            "Password without special character should be rejected"
+            f"Password without {missing} should be rejected"
 
 
 class TestStrongPasswordAccepted:
@@ -119,29 +100,27 @@ class TestStrongPasswordAccepted:
         assert response.status_code == 200, \
             "Password with all requirements should be accepted"
     
+    # All must be 12+ characters
+    @pytest.mark.parametrize("password", [
+        "MyP@ssw0rd!Secure",
+        "Str0ng_P@ssword!",
+        "C0mplex!PassWord",
+        "Valid123$$$abcd",
+        "Aa1!aaaaaaaab",  # 13 chars, minimal requirements met
+    ])
     def test_various_strong_passwords_accepted(
-        self, client: TestClient
+        self, client: TestClient, password: str
     ) -> None:
         """Various strong passwords should be accepted."""
-        # All must be 12+ characters
-        strong_passwords = [
-            "MyP@ssw0rd!Secure",
-            "Str0ng_P@ssword!",
-            "C0mplex!PassWord",
-            "Valid123$$$abcd",
-            "Aa1!aaaaaaaab",  # 13 chars, minimal requirements met
-        ]
-        
-        for password in strong_passwords:
-            response = client.post(
-                f"{settings.API_V1_STR}/users/signup",
-                json={
-                    "email": random_email(),
-                    "password": password,
-                },
-            )
-            assert response.status_code == 200, \
-                f"Strong password '{password}' should be accepted"
+        response = client.post(
+            f"{settings.API_V1_STR}/users/signup",
+            json={
+                "email": random_email(),
+                "password": password,
+            },
+        )
+        assert response.status_code == 200, \
+            f"Strong password '{password}' should be accepted"
 
 
 class TestMinimum12Characters:
@@ -224,29 +203,27 @@ class TestCommonPasswordsRejected:
     The prompt says: "cannot be in a list of common passwords (include at least 100 common passwords)"
     """
     
+    # Common passwords that might meet character requirements
+    @pytest.mark.parametrize("password", [
+        "Password123!",
+        "Qwerty12345!",
+        "Welcome123!!",
+        "Admin12345!!",
+    ])
     def test_common_password_rejected(
-        self, client: TestClient
+        self, client: TestClient, password: str
     ) -> None:
         """Common passwords should be rejected even if they meet other requirements."""
-        # Common passwords that might meet character requirements
-        common_passwords = [
-            "Password123!",
-            "Qwerty12345!",
-            "Welcome123!!",
-            "Admin12345!!",
-        ]
-        
-        for password in common_passwords:
-            response = client.post(
-                f"{settings.API_V1_STR}/users/signup",
-                json={
-                    "email": random_email(),
-                    "password": password,
-                },
-            )
-            # Should be rejected as common password
-            assert response.status_code == 422, \
-                f"Common password '{password}' should be rejected"
+        response = client.post(
+            f"{settings.API_V1_STR}/users/signup",
+            json={
+                "email": random_email(),
+                "password": password,
+            },
+        )
+        # Should be rejected as common password
+        assert response.status_code == 422, \
+            f"Common password '{password}' should be rejected"
 
 
 class TestAllFailuresListed:
@@ -279,13 +256,10 @@ class TestAllFailuresListed:
                 "Should list ALL validation failures, not just the first one"
         elif isinstance(detail, str):
             # Count different requirement mentions
-            requirements_mentioned = sum([
-                "length" in detail.lower() or "character" in detail.lower() or "12" in detail,
-                "upper" in detail.lower(),
-                "lower" in detail.lower(),
-                "digit" in detail.lower() or "number" in detail.lower(),
-                "special" in detail.lower() or "symbol" in detail.lower(),
-            ])
+            detail_lower = detail.lower()
+            requirements_mentioned = sum(
+                1 for pattern in _REQUIREMENT_PATTERNS if pattern.search(detail_lower)
+            )
             assert requirements_mentioned >= 2, \
                 "Error message should list multiple failing requirements"
 
@@ -293,29 +267,27 @@ class TestAllFailuresListed:
 class TestPasswordPolicyOnSignup:
     """Test that policy is enforced on signup."""
     
+    @pytest.mark.parametrize("password", [
+        "12345678",      # No letters
+        "password",      # No digits or special
+        "Password",      # No digits or special
+        "Password1",     # No special
+        "password1!",    # No uppercase
+        "PASSWORD1!",    # No lowercase
+    ])
     def test_weak_passwords_rejected_on_signup(
-        self, client: TestClient
+        self, client: TestClient, password: str
     ) -> None:
         """Weak passwords should be rejected on signup."""
-        weak_passwords = [
-            "12345678",      # No letters
-            "password",      # No digits or special
-            "Password",      # No digits or special
-            "Password1",     # No special
-            "password1!",    # No uppercase
-            "PASSWORD1!",    # No lowercase
-        ]
-        
-        for password in weak_passwords:
-            response = client.post(
-                f"{settings.API_V1_STR}/users/signup",
-                json={
-                    "email": random_email(),
-                    "password": password,
-                },
-            )
-            assert response.status_code == 422, \
-                f"Weak password '{password}' should be rejected on signup"
+        response = client.post(
+            f"{settings.API_V1_STR}/users/signup",
+            json={
+                "email": random_email(),
+                "password": password,
+            },
+        )
+        assert response.status_code == 422, \
+            f"Weak password '{password}' should be rejected on signup"
 
 
 class TestPasswordPolicyOnUpdate:
@@ -370,13 +342,7 @@ class TestPasswordPolicyOnAdminCreate:
         self, client: TestClient, superuser_token_headers: dict[str, str]
     ) -> None:
         """Weak password should be rejected when admin creates user."""
-        from unittest.mock import patch
-        
-        with (
-            patch("app.utils.send_email", return_value=None),
-            patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
-            patch("app.core.config.settings.SMTP_USER", "admin@example.com"),
-        ):
+        with _mock_smtp():
             response = client.post(
                 f"{settings.API_V1_STR}/users/",
                 headers=superuser_token_headers,
@@ -410,16 +376,7 @@ class TestHelpfulErrorMessages:
         detail_str = str(data.get("detail", "")).lower()
         
         # Should mention at least some requirements
-        keywords = [
-            "uppercase", "upper", "capital",
-            "lowercase", "lower",
-            "digit", "number", "numeric",
-            "special", "symbol", "character",
-            "length", "characters", "minimum"
-        ]
-        
-        has_helpful_hint = any(kw in detail_str for kw in keywords)
-        assert has_helpful_hint, \
+        assert _HELPFUL_HINT.search(detail_str), \
             f"Error should mention requirements. Got: {data.get('detail')}"
 
 
@@ -15,41 +15,57 @@ Tests based SOLELY on prompt requirements:
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from httpx import Response
 
 from app.core.config import settings
 
 
 pytestmark = pytest.mark.aspect_bench
 
+# Count metrics (with their accepted aliases) that can never be negative;
+# overflow is left out since SQLAlchemy reports it as negative below pool_size
+_NON_NEGATIVE_KEYS = (
+    "pool_size",
+    "checked_out", "in_use", "active",
+    "checked_in", "idle", "available",
+    "invalid",
+)
+
+
+@pytest.fixture(scope="module")
+def pool_status(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> Response:
+    """Superuser GET of the pool status endpoint, shared by the read-only tests."""
+    return client.get(
+        f"{settings.API_V1_STR}/utils/db-pool-status",
+        headers=superuser_token_headers,
+    )
+
+
+@pytest.fixture(scope="module")
+def pool_status_data(pool_status: Response) -> dict:
+    """Parsed JSON body of the shared pool status response."""
+    return pool_status.json()
+
 
 class TestPoolMetricsEndpointExists:
     """Test that pool metrics endpoint exists."""
     
     def test_endpoint_exists(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status: Response
     ) -> None:
         """Pool metrics endpoint should exist."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
         # Should not be 404
-        assert response.status_code != 404, \
+        assert pool_status.status_code != 404, \
             "GET /api/v1/utils/db-pool-status endpoint must exist"
     
     def test_endpoint_returns_json(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status: Response
     ) -> None:
         """Endpoint should return JSON response."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        assert response.status_code == 200
-        assert response.headers.get("content-type", "").startswith("application/json")
+        assert pool_status.status_code == 200
+        assert pool_status.headers.get("content-type", "").startswith("application/json")
 
 
 class TestPoolMetricsAuth:
@@ -77,82 +93,52 @@ class TestPoolMetricsAuth:
             "Pool metrics endpoint must require superuser"
     
     def test_superuser_can_access(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status: Response
     ) -> None:
         """Superuser should be able to access endpoint."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        assert response.status_code == 200
+        assert pool_status.status_code == 200
 
 
 class TestPoolMetricsContent:
     """Test that response contains required metrics."""
     
     def test_has_pool_size(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status_data: dict
     ) -> None:
         """Response should include pool_size."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = pool_status_data
         assert "pool_size" in data, "Response must include pool_size"
         assert isinstance(data["pool_size"], int)
     
     def test_has_checked_out(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status_data: dict
     ) -> None:
         """Response should include checked_out (connections in use)."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = pool_status_data
         assert "checked_out" in data or "in_use" in data or "active" in data, \
             "Response must include checked_out/in_use/active connections"
     
     def test_has_checked_in(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status_data: dict
     ) -> None:
         """Response should include checked_in (idle connections)."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = pool_status_data
         assert "checked_in" in data or "idle" in data or "available" in data, \
             "Response must include checked_in/idle/available connections"
     
     def test_has_overflow(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status_data: dict
     ) -> None:
         """Response should include overflow count."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = pool_status_data
         assert "overflow" in data or "max_overflow" in data, \
             "Response must include overflow info"
     
     def test_has_healthy_indicator(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status_data: dict
     ) -> None:
         """Response should include healthy boolean."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = pool_status_data
         assert "healthy" in data or "status" in data, \
             "Response must include healthy/status indicator"
         
@@ -164,30 +150,21 @@ class TestPoolMetricsAccuracy:
     """Test that metrics are accurate."""
     
     def test_metrics_are_non_negative(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status_data: dict
     ) -> None:
         """All numeric metrics should be non-negative."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = pool_status_data
         
-        for key, value in data.items():
-            if isinstance(value, (int, float)) and key != "overflow":
+        for key in _NON_NEGATIVE_KEYS:
+            value = data.get(key)
+            if isinstance(value, (int, float)):
                 assert value >= 0, f"{key} must be non-negative"
     
     def test_healthy_true_when_pool_ok(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, pool_status_data: dict
     ) -> None:
         """Healthy should be true when pool is functioning normally."""
-        response = client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        data = response.json()
+        data = pool_status_data
         
         # If we can make the request, pool should be healthy
         if "healthy" in data:
@@ -198,18 +175,14 @@ class TestNoPerformanceImpact:
     """Test that metrics don't impact normal operations."""
     
     def test_items_endpoint_still_works(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
+        self, client: TestClient, pool_status: Response,
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Regular endpoints should still work normally."""
-        # Get metrics
-        client.get(
-            f"{settings.API_V1_STR}/utils/db-pool-status",
-            headers=superuser_token_headers,
-        )
-        
-        # Normal operations should still work
+        # Metrics have already been read via pool_status
+        # Normal DB-backed operations should still work; one row is enough to prove it
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            f"{settings.API_V1_STR}/items/?limit=1",
             headers=superuser_token_headers,
         )
         
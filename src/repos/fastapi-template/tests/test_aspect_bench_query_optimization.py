@@ -16,6 +16,11 @@ NOTE: Query optimization is hard to test without profiling.
 We'll focus on verifiable improvements like index existence.
 """
 
+import functools
+import uuid
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
@@ -27,73 +32,147 @@ from tests.utils.item import create_random_item
 
 pytestmark = pytest.mark.aspect_bench
 
+_ITEMS_URL = f"{settings.API_V1_STR}/items"
+# Query budget for one items listing, independent of how many items or owners it returns
+_MAX_LIST_QUERIES = 4
+
+
+@functools.cache
+def _item_columns() -> frozenset[str]:
+    """Column names of the mapped Item table, reflected once per process."""
+    from sqlalchemy import inspect
+    
+    return frozenset(column.name for column in inspect(Item).columns)
+
+
+@pytest.fixture(scope="module")
+def item_indexes(db: Session) -> list[dict]:
+    """Index definitions of the item table, inspected once per module."""
+    from sqlalchemy import inspect
+    
+    return inspect(db.get_bind()).get_indexes("item")
+
 
 class TestIndexesExist:
     """Test that proper indexes are added."""
     
-    def test_owner_id_index_exists(self, db: Session) -> None:
+    def test_owner_id_index_exists(self, item_indexes: list[dict]) -> None:
         """Item.owner_id should have an index for faster lookups."""
-        from sqlalchemy import inspect
-        
-        inspector = inspect(db.get_bind())
-        indexes = inspector.get_indexes("item")
-        
         # Look for an index on owner_id
-        owner_id_indexed = False
-        for idx in indexes:
-            columns = idx.get("column_names", [])
-            if "owner_id" in columns:
-                owner_id_indexed = True
-                break
+        owner_id_indexed = any(
+            "owner_id" in idx.get("column_names", []) for idx in item_indexes
+        )
         
         assert owner_id_indexed, \
             "owner_id column should be indexed for query optimization"
     
-    def test_item_table_has_indexes(self, db: Session) -> None:
+    def test_item_table_has_indexes(self, item_indexes: list[dict]) -> None:
         """Item table should have at least some indexes."""
-        from sqlalchemy import inspect
-        
-        inspector = inspect(db.get_bind())
-        indexes = inspector.get_indexes("item")
-        
         # Should have at least primary key + one other index
-        assert len(indexes) >= 1, \
+        assert len(item_indexes) >= 1, \
             "Item table should have indexes for optimization"
+    
+    def test_owner_filter_uses_index(self, db: Session) -> None:
+        """The per-owner items lookup should be planned as an index search, not a table scan."""
+        from sqlalchemy import text
+        
+        # The suite runs on SQLite; its plan rows are (id, parent, notused, detail)
+        plan = db.exec(
+            text("EXPLAIN QUERY PLAN SELECT * FROM item WHERE owner_id = :owner_id"),
+            params={"owner_id": str(uuid.uuid4())},
+        ).all()
+        details = [row[-1] for row in plan]
+        
+        assert any("USING" in detail and "INDEX" in detail for detail in details), \
+            f"Filtering items by owner_id should use an index, got plan: {details}"
 
 
 class TestQueryEfficiency:
     """Test query efficiency patterns."""
     
     def test_list_items_is_efficient(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, bulk_items: Callable[[int], list[Item]],
+        query_counter: Callable[[], AbstractContextManager[list[str]]],
+        superuser_token_headers: dict[str, str]
     ) -> None:
-        """Listing items should work efficiently."""
-        # Create some items
-        for _ in range(5):
-            create_random_item(db)
+        """Listing items should not issue a query per item (N+1)."""
+        # 20 items spread across 5 owners
+        seeded = [item for _ in range(5) for item in bulk_items(4)]
         
-        # This should work without N+1 issues
-        response = client.get(
-            f"{settings.API_V1_STR}/items/",
-            headers=superuser_token_headers,
-        )
+        with query_counter() as queries:
+            response = client.get(
+                f"{_ITEMS_URL}/",
+                headers=superuser_token_headers,
+            )
         assert response.status_code == 200
         
         # Verify we get data
         data = response.json()
         assert len(data["data"]) >= 5
+        
+        # Auth user lookup + count + page, plus at most one batched owner load
+        assert len(queries) <= _MAX_LIST_QUERIES, \
+            f"Listing {len(seeded)} items took {len(queries)} queries (N+1 pattern)"
+    
+    def test_list_query_count_does_not_scale_with_rows(
+        self, client: TestClient, bulk_items: Callable[[int], list[Item]],
+        query_counter: Callable[[], AbstractContextManager[list[str]]],
+        superuser_token_headers: dict[str, str]
+    ) -> None:
+        """The number of queries per listing should not grow with the number of items."""
+        bulk_items(5)
+        with query_counter() as few:
+            client.get(f"{_ITEMS_URL}/", headers=superuser_token_headers)
+        
+        bulk_items(95)
+        with query_counter() as many:
+            response = client.get(f"{_ITEMS_URL}/", headers=superuser_token_headers)
+        assert response.status_code == 200
+        
+        assert len(many) == len(few), \
+            f"Query count grew from {len(few)} to {len(many)} as items were added (N+1 pattern)"
+    
+    def test_list_query_count_does_not_scale_with_owners(
+        self, client: TestClient, bulk_items: Callable[[int], list[Item]],
+        query_counter: Callable[[], AbstractContextManager[list[str]]],
+        superuser_token_headers: dict[str, str]
+    ) -> None:
+        """Owners should be loaded in a batch (or not at all), never lazily per owner."""
+        # Two equal-size batches at the tail of the table: one owner, then ten owners
+        one_owner = bulk_items(10)
+        ten_owners = [item for _ in range(10) for item in bulk_items(1)]
+        total = client.get(f"{_ITEMS_URL}/?limit=1", headers=superuser_token_headers).json()["count"]
+        
+        def _measure(skip: int, seeded: list[Item]) -> list[str]:
+            with query_counter() as queries:
+                response = client.get(
+                    f"{_ITEMS_URL}/?skip={skip}&limit={len(seeded)}",
+                    headers=superuser_token_headers,
+                )
+            assert response.status_code == 200
+            page_ids = {i["id"] for i in response.json()["data"]}
+            # The listing has no ORDER BY; without insertion order the pages are unknown
+            if page_ids != {str(item.id) for item in seeded}:
+                pytest.skip("Listing order does not expose the seeded items on a known page")
+            return queries
+        
+        few = _measure(total - 20, one_owner)
+        many = _measure(total - 10, ten_owners)
+        
+        assert len(many) == len(few), \
+            f"Query count grew from {len(few)} to {len(many)} as owners were added (lazy owner loads)"
     
     def test_pagination_uses_efficient_count(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, bulk_items: Callable[[int], list[Item]],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Count query should be efficient (not load all data)."""
         # Create items
-        for _ in range(10):
-            create_random_item(db)
+        bulk_items(10)
         
         # Get with small limit - count should still be correct
         response = client.get(
-            f"{settings.API_V1_STR}/items/?limit=2",
+            f"{_ITEMS_URL}/?limit=2",
             headers=superuser_token_headers,
         )
         
@@ -112,7 +191,7 @@ class TestFunctionalityPreserved:
     ) -> None:
         """Items list should still work after optimization."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -123,7 +202,7 @@ class TestFunctionalityPreserved:
     ) -> None:
         """Filtering by owner should still work."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=normal_user_token_headers,
         )
         assert response.status_code == 200
@@ -135,7 +214,7 @@ class TestFunctionalityPreserved:
         item = create_random_item(db)
         
         response = client.get(
-            f"{settings.API_V1_STR}/items/{item.id}",
+            f"{_ITEMS_URL}/{item.id}",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -146,28 +225,8 @@ class TestModelHasIndex:
     
     def test_item_model_has_index_on_owner(self) -> None:
         """Item model should declare index on owner_id."""
-        from app.models import Item
-        from sqlmodel import Field
-        
-        # Check if owner_id field has index=True
-        # This is a structural check of the model
-        model_fields = Item.model_fields
-        
-        if "owner_id" in model_fields:
-            field_info = model_fields["owner_id"]
-            # Check for index in metadata
-            # SQLModel/Pydantic stores this differently
-            pass
-        
-        # Alternative: check the table definition
-        from sqlalchemy import inspect
-        
-        # Get table columns
-        mapper = inspect(Item)
-        columns = mapper.columns
-        
         # The test mainly ensures the model/table structure supports efficient queries
-        assert "owner_id" in [c.name for c in columns], \
+        assert "owner_id" in _item_columns(), \
             "Item should have owner_id column"
 
 
@@ -180,7 +239,7 @@ class TestOptimizationEdgeCases:
         """Empty result should be returned efficiently."""
         # A user with no items should get fast response
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=normal_user_token_headers,
         )
         assert response.status_code == 200
@@ -192,7 +251,7 @@ class TestOptimizationEdgeCases:
     ) -> None:
         """Large offset should be handled efficiently."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/?skip=1000",
+            f"{_ITEMS_URL}/?skip=1000",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -13,9 +13,11 @@ Tests based SOLELY on prompt requirements:
 4. Block should be temporary (eventually lifts)
 """
 
-import time
+from urllib.parse import urlencode
+
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 from sqlmodel import Session
 
 from app.core.config import settings
@@ -23,6 +25,27 @@ from app.core.config import settings
 
 pytestmark = pytest.mark.aspect_bench
 
+_LOGIN_URL = f"{settings.API_V1_STR}/login/access-token"
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+def _login_until_limited(
+    client: TestClient, username: str, max_attempts: int = 10
+) -> tuple[Response | None, int]:
+    """
+    Fail logins for `username` until the server answers 429.
+
+    Returns the first 429 response (None if it never came) and the number
+    of attempts made, counting the limited one.
+    """
+    # Same form body every attempt: encode it once instead of per post
+    body = urlencode({"username": username, "password": "wrongpassword"}).encode()
+    for attempt in range(1, max_attempts + 1):
+        response = client.post(_LOGIN_URL, content=body, headers=_FORM_HEADERS)
+        if response.status_code == 429:
+            return response, attempt
+    return None, max_attempts
+
 
 class TestRateLimitBasic:
     """Test that rate limiting exists on the login endpoint."""
@@ -36,7 +59,7 @@ class TestRateLimitBasic:
         
         for i in range(10):
             response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
+                _LOGIN_URL,
                 data={
                     "username": f"nonexistent{i}@example.com",
                     "password": "wrongpassword",
@@ -54,22 +77,11 @@ class TestRateLimitBasic:
         self, client: TestClient
     ) -> None:
         """Rate limit response should be 429 Too Many Requests."""
-        # Trigger rate limiting
-        for i in range(10):
-            response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
-                data={
-                    "username": "attacker@example.com",
-                    "password": "wrongpassword",
-                },
-            )
-            
-            if response.status_code == 429:
-                # Verify it's actually 429
-                assert response.status_code == 429
-                return
+        response, _ = _login_until_limited(client, "attacker@example.com")
         
-        pytest.fail("Never got rate limited - rate limiting not implemented")
+        if response is None:
+            pytest.fail("Never got rate limited - rate limiting not implemented")
+        assert response.status_code == 429
 
 
 class TestRateLimitThreshold:
@@ -82,7 +94,7 @@ class TestRateLimitThreshold:
         # First 3 attempts should work (even if they fail auth)
         for i in range(3):
             response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
+                _LOGIN_URL,
                 data={
                     "username": f"test_threshold_{i}@example.com",
                     "password": "wrongpassword",
@@ -96,25 +108,15 @@ class TestRateLimitThreshold:
         self, client: TestClient
     ) -> None:
         """Rate limit should trigger around 5 attempts per the prompt."""
-        attempt_count = 0
-        
-        for i in range(15):
-            response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
-                data={
-                    "username": "threshold_test@example.com",
-                    "password": "wrongpassword",
-                },
-            )
-            attempt_count += 1
-            
-            if response.status_code == 429:
-                # Should be blocked somewhere between 4-10 attempts
-                assert 4 <= attempt_count <= 10, \
-                    f"Rate limit triggered after {attempt_count} attempts (expected ~5)"
-                return
+        response, attempt_count = _login_until_limited(
+            client, "threshold_test@example.com", max_attempts=15
+        )
         
-        pytest.fail("Rate limit never triggered")
+        if response is None:
+            pytest.fail("Rate limit never triggered")
+        # Should be blocked somewhere between 4-10 attempts
+        assert 4 <= attempt_count <= 10, \
+            f"Rate limit triggered after {attempt_count} attempts (expected ~5)"
 
 
 class TestRateLimitResponse:
@@ -124,25 +126,15 @@ class TestRateLimitResponse:
         self, client: TestClient
     ) -> None:
         """Rate limit response should include helpful message."""
-        # Trigger rate limit
-        for i in range(10):
-            response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
-                data={
-                    "username": "message_test@example.com",
-                    "password": "wrongpassword",
-                },
-            )
-            
-            if response.status_code == 429:
-                data = response.json()
-                # Should have some message
-                assert "detail" in data or "message" in data or "error" in data, \
-                    "Rate limit response should include a message"
-                return
+        response, _ = _login_until_limited(client, "message_test@example.com")
         
-        pytest.fail("Never got rate limited")
-    
+        if response is None:
+            pytest.fail("Never got rate limited")
+        data = response.json()
+        # Should have some message
+        assert "detail" in data or "message" in data or "error" in data, \
+            "Rate limit response should include a message"
+
     def test_rate_limit_has_retry_after_header(
         self, client: TestClient
     ) -> None:
@@ -151,26 +143,19 @@ class TestRateLimitResponse:
         
         The prompt specifies: "with a Retry-After header indicating seconds until the block expires"
         """
-        # Trigger rate limit
-        for i in range(10):
-            response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
-                data={
-                    "username": "retry_header_test@example.com",
-                    "password": "wrongpassword",
-                },
-            )
-            
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                assert retry_after is not None, \
-                    "Rate limit response MUST have Retry-After header"
-                # Should be a number (seconds)
-                assert retry_after.isdigit(), \
-                    f"Retry-After should be seconds, got: {retry_after}"
-                return
+        response, _ = _login_until_limited(client, "retry_header_test@example.com")
         
-        pytest.fail("Never got rate limited")
+        if response is None:
+            pytest.fail("Never got rate limited")
+        retry_after = response.headers.get("Retry-After")
+        assert retry_after is not None, \
+            "Rate limit response MUST have Retry-After header"
+        # Should be a number (seconds)
+        assert retry_after.isdigit(), \
+            f"Retry-After should be seconds, got: {retry_after}"
+        # A block that is still in force must last at least one more second
+        assert int(retry_after) >= 1, \
+            f"Retry-After should be a positive wait, got: {retry_after}"
 
 
 class TestRateLimitPerUsername:
@@ -187,20 +172,11 @@ class TestRateLimitPerUsername:
         Rate limiting should be per-username - different usernames have separate limits.
         """
         # Max out rate limit for user1
-        for i in range(10):
-            response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
-                data={
-                    "username": "rate_limited_user@example.com",
-                    "password": "wrongpassword",
-                },
-            )
-            if response.status_code == 429:
-                break
+        _login_until_limited(client, "rate_limited_user@example.com")
         
         # A DIFFERENT username should NOT be rate limited
         response = client.post(
-            f"{settings.API_V1_STR}/login/access-token",
+            _LOGIN_URL,
             data={
                 "username": "fresh_user_not_limited@example.com",
                 "password": "wrongpassword",
@@ -216,22 +192,9 @@ class TestRateLimitPerUsername:
         """
         Same username should share the rate limit across requests.
         """
-        target_username = "shared_limit_test@example.com"
-        got_limited = False
-        
-        for i in range(10):
-            response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
-                data={
-                    "username": target_username,
-                    "password": "wrongpassword",
-                },
-            )
-            if response.status_code == 429:
-                got_limited = True
-                break
+        response, _ = _login_until_limited(client, "shared_limit_test@example.com")
         
-        assert got_limited, \
+        assert response is not None, \
             "Same username should accumulate failed attempts and get rate limited"
 
 
@@ -243,31 +206,16 @@ class TestRateLimitTemporary:
     ) -> None:
         """Rate limit should eventually expire (be temporary)."""
         # First trigger rate limit
-        rate_limited = False
-        for i in range(10):
-            response = client.post(
-                f"{settings.API_V1_STR}/login/access-token",
-                data={
-                    "username": "expire_test@example.com",
-                    "password": "wrongpassword",
-                },
-            )
-            if response.status_code == 429:
-                rate_limited = True
-                break
+        response, _ = _login_until_limited(client, "expire_test@example.com")
         
-        if not rate_limited:
+        if response is None:
             pytest.skip("Could not trigger rate limit")
         
-        # Wait a bit (prompt says per minute, so wait 60+ seconds for full test)
-        # For practical testing, we'll check if there's any concept of expiry
-        # by checking the Retry-After header or trying after a short wait
-        
-        time.sleep(2)  # Short wait to at least verify it doesn't instantly reset
-        
-        # This is a minimal check - full test would wait 60+ seconds
+        # A real expiry check would have to wait out the block (a minute or more), and
+        # the limiter's clock is internal to the implementation, so it cannot be faked here.
+        # This is a minimal check that the endpoint keeps answering once limited.
         response = client.post(
-            f"{settings.API_V1_STR}/login/access-token",
+            _LOGIN_URL,
             data={
                 "username": "expire_test@example.com",
                 "password": "wrongpassword",
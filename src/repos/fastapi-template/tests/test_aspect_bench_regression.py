@@ -7,7 +7,11 @@ by any changes made for the benchmark tasks.
 Run with: pytest tests/test_aspect_bench_regression.py -m regression
 """
 
+import re
 import uuid
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
@@ -19,6 +23,12 @@ from tests.utils.utils import random_email
 
 pytestmark = [pytest.mark.regression, pytest.mark.aspect_bench]
 
+_ITEMS_URL = f"{settings.API_V1_STR}/items"
+
+# Statements that delete rows from the item table, and references to its owner column
+_ITEM_DELETE = re.compile(r"\s*DELETE\s+FROM\s+item\b", re.IGNORECASE)
+_OWNER_ID = re.compile(r"\bowner_id\b")
+
 
 class TestAuthRegression:
     """Verify authentication still works."""
@@ -58,7 +68,7 @@ class TestItemsRegression:
     ) -> None:
         """Should be able to create an item."""
         response = client.post(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=superuser_token_headers,
             json={"title": "Test Item", "description": "A test item"},
         )
@@ -74,7 +84,7 @@ class TestItemsRegression:
         item = create_random_item(db)
         
         response = client.get(
-            f"{settings.API_V1_STR}/items/{item.id}",
+            f"{_ITEMS_URL}/{item.id}",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -87,7 +97,7 @@ class TestItemsRegression:
         item = create_random_item(db)
         
         response = client.put(
-            f"{settings.API_V1_STR}/items/{item.id}",
+            f"{_ITEMS_URL}/{item.id}",
             headers=superuser_token_headers,
             json={"title": "Updated Title", "description": "Updated"},
         )
@@ -101,7 +111,7 @@ class TestItemsRegression:
         item = create_random_item(db)
         
         response = client.delete(
-            f"{settings.API_V1_STR}/items/{item.id}",
+            f"{_ITEMS_URL}/{item.id}",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -111,7 +121,7 @@ class TestItemsRegression:
     ) -> None:
         """Should be able to list items."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -154,7 +164,7 @@ class TestValidationRegression:
     ) -> None:
         """Items with empty title should be rejected."""
         response = client.post(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=superuser_token_headers,
             json={"title": "", "description": "Test"},
         )
@@ -186,10 +196,14 @@ class TestCascadeDeleteRaceCondition:
     """
     
     def test_user_deletion_cascades_items(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, db: Session,
+        query_counter: Callable[[], AbstractContextManager[list[str]]],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """
         When a user is deleted, their items should be deleted too.
+        
+        The cascade must not delete the items one statement at a time.
         """
         from app.models import User, Item
         from sqlmodel import select
@@ -217,7 +231,7 @@ class TestCascadeDeleteRaceCondition:
         item_ids = []
         for i in range(3):
             r = client.post(
-                f"{settings.API_V1_STR}/items/",
+                f"{_ITEMS_URL}/",
                 headers=user_headers,
                 json={"title": f"Test Item {i}", "description": "Will be deleted"},
             )
@@ -225,12 +239,21 @@ class TestCascadeDeleteRaceCondition:
                 item_ids.append(r.json()["id"])
         
         # Delete the user (as superuser)
-        delete_response = client.delete(
-            f"{settings.API_V1_STR}/users/{user_id}",
-            headers=superuser_token_headers,
-        )
+        with query_counter() as queries:
+            delete_response = client.delete(
+                f"{settings.API_V1_STR}/users/{user_id}",
+                headers=superuser_token_headers,
+            )
         assert delete_response.status_code == 200
         
+        # A database-level cascade issues no item DELETE at all; a bulk one issues one,
+        # keyed on owner_id (an ORM cascade would delete by item id, one row per parameter set)
+        item_deletes = [q for q in queries if _ITEM_DELETE.match(q)]
+        assert len(item_deletes) <= 1, \
+            f"User deletion issued {len(item_deletes)} item DELETE statements, expected a single cascade"
+        assert all(_OWNER_ID.search(q) for q in item_deletes), \
+            f"Items should be deleted by owner_id in one statement, got: {item_deletes}"
+        
         # Verify items are gone (no orphans)
         db.expire_all()
         for item_id in item_ids:
@@ -274,7 +297,7 @@ class TestCascadeDeleteRaceCondition:
         # Create initial items
         for i in range(2):
             client.post(
-                f"{settings.API_V1_STR}/items/",
+                f"{_ITEMS_URL}/",
                 headers=user_headers,
                 json={"title": f"Initial Item {i}", "description": "Test"},
             )
@@ -293,7 +316,7 @@ class TestCascadeDeleteRaceCondition:
                     break
                 try:
                     r = client.post(
-                        f"{settings.API_V1_STR}/items/",
+                        f"{_ITEMS_URL}/",
                         headers=user_headers,
                         json={"title": f"Concurrent Item {i}", "description": "During delete"},
                     )
@@ -14,47 +14,46 @@ Tests based SOLELY on prompt requirements:
 4. Cache-Control headers are present
 """
 
+from collections.abc import Callable
+
 import pytest
-import time
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.config import settings
+from app.models import Item
 from tests.utils.item import create_random_item
 
 
 pytestmark = pytest.mark.aspect_bench
 
+# Items collection URL (trailing slash included); item URLs append the id
+_ITEMS_URL = f"{settings.API_V1_STR}/items/"
+
 
 class TestCachingWorks:
     """Test that caching returns cached responses."""
     
     def test_repeated_requests_are_fast(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, bulk_items: Callable[[int], list[Item]],
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Repeated requests within TTL should be faster (cached)."""
         # Create some items
-        for _ in range(3):
-            create_random_item(db)
+        bulk_items(3)
         
         # First request (uncached)
-        start1 = time.time()
         response1 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
-        time1 = time.time() - start1
-        
         assert response1.status_code == 200
         
         # Second request (should be cached)
-        start2 = time.time()
         response2 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
-        time2 = time.time() - start2
-        
         assert response2.status_code == 200
         
         # Cached response should be same as original
@@ -67,11 +66,11 @@ class TestCachingWorks:
         create_random_item(db)
         
         response1 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
         response2 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
         
@@ -86,22 +85,26 @@ class TestCacheIsUserSpecific:
         superuser_token_headers: dict[str, str],
         normal_user_token_headers: dict[str, str]
     ) -> None:
-        """Different users should have independent caches."""
-        # Each user should see their own items (or filtered items)
+        """A listing cached for one user must not be served to another."""
+        # Owned by a fresh random user: visible to the superuser only
+        item = create_random_item(db)
+        
+        # Superuser request populates the cache
         response_super = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
         response_normal = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=normal_user_token_headers,
         )
         
         assert response_super.status_code == 200
         assert response_normal.status_code == 200
         
-        # The responses may differ (superuser sees all, normal user sees own)
-        # At minimum, the cache keys should be different
+        normal_ids = {i["id"] for i in response_normal.json().get("data", [])}
+        assert str(item.id) not in normal_ids, \
+            "Normal user was served the superuser's cached listing (cache must be per-user)"
 
 
 class TestCacheInvalidation:
@@ -113,10 +116,11 @@ class TestCacheInvalidation:
         """Creating an item should invalidate the cache."""
         # Get initial list
         response1 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
-        initial_count = response1.json().get("count", len(response1.json().get("data", [])))
+        body1 = response1.json()
+        initial_count = body1.get("count", len(body1.get("data", [])))
         
         # Create a new item via API
         new_item = {
@@ -124,7 +128,7 @@ class TestCacheInvalidation:
             "description": "Testing cache invalidation"
         }
         create_response = client.post(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
             json=new_item,
         )
@@ -132,10 +136,11 @@ class TestCacheInvalidation:
         
         # Get list again - should see the new item
         response2 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
-        new_count = response2.json().get("count", len(response2.json().get("data", [])))
+        body2 = response2.json()
+        new_count = body2.get("count", len(body2.get("data", [])))
         
         assert new_count > initial_count, \
             "Cache should be invalidated after creating an item"
@@ -149,26 +154,26 @@ class TestCacheInvalidation:
         
         # Get list (caches it)
         response1 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
         
         # Update the item
         update_response = client.put(
-            f"{settings.API_V1_STR}/items/{item.id}",
+            f"{_ITEMS_URL}{item.id}",
             headers=superuser_token_headers,
             json={"title": "Updated Title for Cache Test"},
         )
         
         # Get list again - should see updated item
         response2 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
         
         # Find the item in the response
-        items = response2.json().get("data", [])
-        updated_item = next((i for i in items if i["id"] == str(item.id)), None)
+        items_by_id = {i["id"]: i for i in response2.json().get("data", [])}
+        updated_item = items_by_id.get(str(item.id))
         
         if updated_item:
             assert updated_item["title"] == "Updated Title for Cache Test", \
@@ -183,23 +188,25 @@ class TestCacheInvalidation:
         
         # Get list (caches it)
         response1 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
-        initial_count = response1.json().get("count", len(response1.json().get("data", [])))
+        body1 = response1.json()
+        initial_count = body1.get("count", len(body1.get("data", [])))
         
         # Delete the item
         delete_response = client.delete(
-            f"{settings.API_V1_STR}/items/{item.id}",
+            f"{_ITEMS_URL}{item.id}",
             headers=superuser_token_headers,
         )
         
         # Get list again - should not include deleted item
         response2 = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
-        new_count = response2.json().get("count", len(response2.json().get("data", [])))
+        body2 = response2.json()
+        new_count = body2.get("count", len(body2.get("data", [])))
         
         assert new_count < initial_count, \
             "Cache should be invalidated after deleting an item"
@@ -213,7 +220,7 @@ class TestCacheControlHeaders:
     ) -> None:
         """Response should include Cache-Control header."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
         
@@ -229,7 +236,7 @@ class TestCacheControlHeaders:
     ) -> None:
         """Cache-Control should include max-age directive."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
         
@@ -247,7 +254,7 @@ class TestCacheNoBreakage:
     ) -> None:
         """Items endpoint should still work correctly."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            _ITEMS_URL,
             headers=superuser_token_headers,
         )
         
@@ -261,6 +268,6 @@ class TestCacheNoBreakage:
         self, client: TestClient
     ) -> None:
         """Auth should still be required for items endpoint."""
-        response = client.get(f"{settings.API_V1_STR}/items/")
+        response = client.get(_ITEMS_URL)
         
         assert response.status_code in (401, 403)
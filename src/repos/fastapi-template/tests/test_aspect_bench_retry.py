@@ -14,16 +14,47 @@ Tests based SOLELY on prompt requirements:
 5. Final failure returns appropriate error
 """
 
-import pytest
-from unittest.mock import Mock, patch, call
+import functools
+import inspect
+import itertools
+import sys
 import time
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
 
 from app.core.config import settings
+from aspect_bench_sources import identifiers
 
 
 pytestmark = pytest.mark.aspect_bench
 
 
+@functools.cache
+def _retry_with_backoff() -> Callable | None:
+    """
+    Locate the retry_with_backoff decorator once per process.
+    
+    Looks in app.utils.retry, then app.core.retry; returns None if neither has it.
+    """
+    try:
+        from app.utils.retry import retry_with_backoff
+    except ImportError:
+        try:
+            from app.core.retry import retry_with_backoff
+        except ImportError:
+            return None
+    return retry_with_backoff
+
+
+@functools.cache
+def _utils_identifiers() -> frozenset[str]:
+    """Identifiers used in app.utils, parsed once per process."""
+    from app import utils
+    return identifiers(inspect.getsource(utils))
+
+
 class TestRetryUtilityExists:
     """Test that retry utility/decorator exists."""
     
@@ -69,119 +100,72 @@ class TestRetryUtilityExists:
 class TestRetryBehavior:
     """Test retry behavior."""
     
-    def test_retry_on_connection_error(self) -> None:
-        """Retry should happen on connection errors."""
-        retry_func = None
-        
-        try:
-            from app.utils.retry import retry_with_backoff
-            retry_func = retry_with_backoff
-        except ImportError:
-            try:
-                from app.core.retry import retry_with_backoff
-                retry_func = retry_with_backoff
-            except ImportError:
-                pytest.skip("Retry utility not found")
+    @pytest.mark.parametrize(
+        ("exception", "failures", "expected_calls", "raises", "message"),
+        [
+            # Transient failure: retried until the third call succeeds
+            (ConnectionError, 2, 3, None, "Should have retried until success"),
+            # Validation error: never retried
+            (ValueError, None, 1, ValueError, "Validation errors should not trigger retry"),
+            # Persistent failure: re-raised after max retries
+            (ConnectionError, None, 4, ConnectionError, "Should try once + 3 retries = 4 total"),
+        ],
+        ids=["retry_on_connection_error", "no_retry_on_validation_error", "max_retries_exhausted"],
+    )
+    def test_retry_behavior(
+        self, exception: type[Exception], failures: int | None, expected_calls: int,
+        raises: type[Exception] | None, message: str,
+    ) -> None:
+        """Retry transient errors until success or max_retries; never retry others."""
+        retry_func = _retry_with_backoff()
+        if retry_func is None:
+            pytest.skip("Retry utility not found")
         
         call_count = 0
         
         @retry_func(max_retries=3, base_delay=0.01)  # Fast for testing
-        def flaky_function():
+        def function_under_retry():
             nonlocal call_count
             call_count += 1
-            if call_count < 3:
-                raise ConnectionError("Transient failure")
+            # failures=None means every call fails
+            if failures is None or call_count <= failures:
+                raise exception("Injected failure")
             return "success"
         
-        result = flaky_function()
-        assert result == "success"
-        assert call_count == 3, "Should have retried until success"
-    
-    def test_no_retry_on_validation_error(self) -> None:
-        """Validation errors should not trigger retry."""
-        retry_func = None
-        
-        try:
-            from app.utils.retry import retry_with_backoff
-            retry_func = retry_with_backoff
-        except ImportError:
-            try:
-                from app.core.retry import retry_with_backoff
-                retry_func = retry_with_backoff
-            except ImportError:
-                pytest.skip("Retry utility not found")
-        
-        call_count = 0
-        
-        @retry_func(max_retries=3, base_delay=0.01)
-        def validation_failing_function():
-            nonlocal call_count
-            call_count += 1
-            raise ValueError("Invalid input")  # Should not retry
-        
-        with pytest.raises(ValueError):
-            validation_failing_function()
-        
-        assert call_count == 1, "Validation errors should not trigger retry"
-    
-    def test_max_retries_exhausted(self) -> None:
-        """Should fail after max retries exhausted."""
-        retry_func = None
-        
-        try:
-            from app.utils.retry import retry_with_backoff
-            retry_func = retry_with_backoff
-        except ImportError:
-            try:
-                from app.core.retry import retry_with_backoff
-                retry_func = retry_with_backoff
-            except ImportError:
-                pytest.skip("Retry utility not found")
-        
-        call_count = 0
-        
-        @retry_func(max_retries=3, base_delay=0.01)
-        def always_failing_function():
-            nonlocal call_count
-            call_count += 1
-            raise ConnectionError("Persistent failure")
-        
-        with pytest.raises(ConnectionError):
-            always_failing_function()
+        if raises is None:
+            assert function_under_retry() == "success"
+        else:
+            with pytest.raises(raises):
+                function_under_retry()
         
-        assert call_count == 4, "Should try once + 3 retries = 4 total"
+        assert call_count == expected_calls, message
 
 
 class TestExponentialBackoff:
     """Test exponential backoff timing."""
     
-    def test_backoff_increases_exponentially(self) -> None:
+    def test_backoff_increases_exponentially(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Delays should increase exponentially."""
-        retry_func = None
+        retry_func = _retry_with_backoff()
+        if retry_func is None:
+            pytest.skip("Retry utility not found")
         
-        try:
-            from app.utils.retry import retry_with_backoff
-            retry_func = retry_with_backoff
-        except ImportError:
-            try:
-                from app.core.retry import retry_with_backoff
-                retry_func = retry_with_backoff
-            except ImportError:
-                pytest.skip("Retry utility not found")
+        # Record the requested backoff instead of sleeping through it (~0.7s per run).
+        # Also covers a retry module that did `from time import sleep`.
+        sleeps: list[float] = []
+        real_sleep = time.sleep
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        retry_module = sys.modules.get(retry_func.__module__)
+        if getattr(retry_module, "sleep", None) is real_sleep:
+            monkeypatch.setattr(retry_module, "sleep", sleeps.append)
         
-        delays = []
-        last_call = [time.time()]
-        call_count = 0
+        # Call timestamps, only needed if the implementation does not sleep via time.sleep
+        calls: list[float] = []
         
         @retry_func(max_retries=3, base_delay=0.1)
         def timing_function():
-            nonlocal call_count
-            now = time.time()
-            if call_count > 0:
-                delays.append(now - last_call[0])
-            last_call[0] = now
-            call_count += 1
-            if call_count < 4:
+            calls.append(time.monotonic())
+            if len(calls) < 4:
                 raise ConnectionError("Fail")
             return "done"
         
@@ -190,10 +174,18 @@ class TestExponentialBackoff:
         except:
             pass
         
-        # Check that delays are increasing (exponential)
-        if len(delays) >= 2:
-            assert delays[1] > delays[0], \
-                "Backoff delays should increase (exponential)"
+        if sleeps:
+            # Requested delays are exact: check the doubling (1s, 2s, 4s), allowing 20% slack
+            assert len(sleeps) >= 2 and sleeps[1] > sleeps[0], \
+                f"Backoff delays should increase (exponential), got: {sleeps}"
+            assert sleeps[1] >= 2 * sleeps[0] * 0.8, \
+                f"Backoff should roughly double per retry, got: {sleeps}"
+        else:
+            # Fall back to measured gaps between calls; only the trend is reliable
+            delays = [later - earlier for earlier, later in itertools.pairwise(calls)]
+            if len(delays) >= 2:
+                assert delays[1] > delays[0], \
+                    "Backoff delays should increase (exponential)"
 
 
 class TestRetryLogging:
@@ -201,17 +193,9 @@ class TestRetryLogging:
     
     def test_retry_attempts_are_logged(self) -> None:
         """Each retry attempt should be logged."""
-        retry_func = None
-        
-        try:
-            from app.utils.retry import retry_with_backoff
-            retry_func = retry_with_backoff
-        except ImportError:
-            try:
-                from app.core.retry import retry_with_backoff
-                retry_func = retry_with_backoff
-            except ImportError:
-                pytest.skip("Retry utility not found")
+        retry_func = _retry_with_backoff()
+        if retry_func is None:
+            pytest.skip("Retry utility not found")
         
         with patch('logging.Logger.warning') as mock_log:
             call_count = 0
@@ -235,23 +219,16 @@ class TestRetryAppliedToEmail:
     
     def test_email_utils_has_retry(self) -> None:
         """Email sending should use retry mechanism."""
-        import inspect
-        
         try:
-            from app import utils
-            source = inspect.getsource(utils)
-            
-            # Check if retry is used in utils module
-            has_retry = (
-                "retry" in source.lower() or
-                "@retry" in source or
-                "retry_with_backoff" in source
-            )
-            
-            assert has_retry, \
-                "Email utils should use retry mechanism"
+            utils_identifiers = _utils_identifiers()
         except ImportError:
             pytest.skip("Could not import app.utils")
+        
+        # Check if retry is used in utils module (decorator, import or call)
+        has_retry = any("retry" in name.lower() for name in utils_identifiers)
+        
+        assert has_retry, \
+            "Email utils should use retry mechanism"
 
 
 class TestRetryReusability:
@@ -259,17 +236,9 @@ class TestRetryReusability:
     
     def test_retry_can_be_parameterized(self) -> None:
         """Retry should accept configuration parameters."""
-        retry_func = None
-        
-        try:
-            from app.utils.retry import retry_with_backoff
-            retry_func = retry_with_backoff
-        except ImportError:
-            try:
-                from app.core.retry import retry_with_backoff
-                retry_func = retry_with_backoff
-            except ImportError:
-                pytest.skip("Retry utility not found")
+        retry_func = _retry_with_backoff()
+        if retry_func is None:
+            pytest.skip("Retry utility not found")
         
         # Should be able to configure retries
         @retry_func(max_retries=5, base_delay=0.01)
@@ -281,17 +250,9 @@ class TestRetryReusability:
     
     def test_retry_works_as_decorator(self) -> None:
         """Retry should work as a decorator."""
-        retry_func = None
-        
-        try:
-            from app.utils.retry import retry_with_backoff
-            retry_func = retry_with_backoff
-        except ImportError:
-            try:
-                from app.core.retry import retry_with_backoff
-                retry_func = retry_with_backoff
-            except ImportError:
-                pytest.skip("Retry utility not found")
+        retry_func = _retry_with_backoff()
+        if retry_func is None:
+            pytest.skip("Retry utility not found")
         
         @retry_func()
         def decorated_function():
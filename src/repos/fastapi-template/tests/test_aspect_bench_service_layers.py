@@ -12,93 +12,90 @@ Tests based SOLELY on prompt requirements:
 3. Functionality should remain the same (no regressions)
 """
 
+import importlib
+import importlib.util
+import re
 import uuid
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.config import settings
+from aspect_bench_sources import identifiers, items_routes_source
 from tests.utils.item import create_random_item
 
 
 pytestmark = pytest.mark.aspect_bench
 
+_ITEMS_URL = f"{settings.API_V1_STR}/items"
+# CRUD verbs a service method name may contain, and one alternation matching any of them
+_CRUD_PATTERNS = ("get", "create", "update", "delete", "list")
+_CRUD_NAME = re.compile("|".join(_CRUD_PATTERNS))
+# Placeholder in expected response values for the id of the item under test
+_ITEM_ID = object()
+
+# (module, attribute) pairs where an items service commonly lives
+_ITEMS_SERVICE_LOCATIONS = (
+    ("app.services.items", "ItemsService"),
+    ("app.services.items", "ItemService"),
+    ("app.services", "items_service"),
+    ("app.services", "ItemsService"),
+    ("app.service.items", "ItemsService"),
+    ("app.items.service", "ItemsService"),
+)
+
+
+def _resolve(module_name: str, attr: str) -> object | None:
+    """
+    Equivalent of `from module_name import attr`, returning None instead of raising.
+    
+    find_spec rules out missing modules without running the import machinery;
+    as with `from ... import`, attr may also be a submodule.
+    """
+    try:
+        if importlib.util.find_spec(module_name) is None:
+            return None
+        module = importlib.import_module(module_name)
+        if hasattr(module, attr):
+            return getattr(module, attr)
+        if importlib.util.find_spec(f"{module_name}.{attr}") is not None:
+            return importlib.import_module(f"{module_name}.{attr}")
+    except ImportError:
+        # A missing parent package makes find_spec itself raise
+        pass
+    return None
+
 
 class TestServiceLayerExists:
     """Test that a service layer exists."""
     
     def test_items_service_exists(self) -> None:
         """There should be an items service class/module."""
-        service_found = False
-        
         # Try common patterns for service location
-        try:
-            from app.services.items import ItemsService
-            service_found = True
-        except ImportError:
-            pass
-        
-        try:
-            from app.services.items import ItemService
-            service_found = True
-        except ImportError:
-            pass
-        
-        try:
-            from app.services import items_service
-            service_found = True
-        except ImportError:
-            pass
-        
-        try:
-            from app.services import ItemsService
-            service_found = True
-        except ImportError:
-            pass
-        
-        try:
-            from app.service.items import ItemsService
-            service_found = True
-        except ImportError:
-            pass
-        
-        try:
-            from app.items.service import ItemsService
-            service_found = True
-        except ImportError:
-            pass
+        service_found = any(
+            _resolve(module_name, attr) is not None
+            for module_name, attr in _ITEMS_SERVICE_LOCATIONS
+        )
         
         assert service_found, \
             "Should have a service layer for items (e.g., app.services.items.ItemsService)"
     
     def test_service_has_crud_methods(self) -> None:
         """Service should have CRUD-like methods."""
-        service = None
-        
         # Try to import service
-        try:
-            from app.services.items import ItemsService
-            service = ItemsService
-        except ImportError:
-            pass
-        
-        try:
-            from app.services.items import ItemService
-            service = ItemService
-        except ImportError:
-            pass
+        service = _resolve("app.services.items", "ItemsService") \
+            or _resolve("app.services.items", "ItemService")
         
         if service is None:
             pytest.skip("Could not import items service")
         
-        # Check for CRUD methods
-        methods = dir(service)
-        crud_patterns = ["get", "create", "update", "delete", "list"]
+        # Check for CRUD methods (public names, lowercased once)
+        methods = {m.lower() for m in dir(service) if not m.startswith("_")}
+        # One regex pass per name; findall so e.g. get_or_create counts for both
+        matched = {hit for m in methods for hit in _CRUD_NAME.findall(m)}
         
-        found_methods = []
-        for pattern in crud_patterns:
-            if any(pattern in m.lower() for m in methods if not m.startswith("_")):
-                found_methods.append(pattern)
+        found_methods = [pattern for pattern in _CRUD_PATTERNS if pattern in matched]
         
         assert len(found_methods) >= 3, \
             f"Service should have CRUD methods. Found: {found_methods}"
@@ -109,35 +106,25 @@ class TestRoutesAreThin:
     
     def test_routes_file_is_smaller(self) -> None:
         """Routes file should be relatively thin after refactoring."""
-        import inspect
-        from app.api.routes import items
-        
-        source = inspect.getsource(items)
-        lines = source.split('\n')
-        
-        # Filter out empty lines and comments
-        code_lines = [l for l in lines if l.strip() and not l.strip().startswith('#')]
+        # Count lines, skipping empty lines and comments, without building a list
+        code_lines = sum(
+            1 for line in items_routes_source().splitlines()
+            if (stripped := line.strip()) and not stripped.startswith('#')
+        )
         
         # After refactoring, the routes file should be reasonably sized
         # (This is a soft check - we're mainly looking for the pattern)
         # A well-refactored routes file should be under ~200 lines
-        assert len(code_lines) < 300, \
-            f"Routes file seems too large ({len(code_lines)} lines). " \
+        assert code_lines < 300, \
+            f"Routes file seems too large ({code_lines} lines). " \
             "Business logic should be in service layer."
     
     def test_routes_use_service(self) -> None:
         """Routes should reference/use the service layer."""
-        import inspect
-        from app.api.routes import items
-        
-        source = inspect.getsource(items)
+        routes_identifiers = identifiers(items_routes_source())
         
-        # Check for service usage patterns
-        uses_service = (
-            "service" in source.lower() or
-            "Service" in source or
-            "_service" in source
-        )
+        # Check for service usage patterns (import, dependency, class or call)
+        uses_service = any("service" in name.lower() for name in routes_identifiers)
         
         assert uses_service, \
             "Routes should use a service layer"
@@ -146,67 +133,36 @@ class TestRoutesAreThin:
 class TestFunctionalityPreserved:
     """Test that all functionality still works after refactoring."""
     
-    def test_can_list_items(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """Should still be able to list items."""
-        response = client.get(
-            f"{settings.API_V1_STR}/items/",
-            headers=superuser_token_headers,
-        )
-        assert response.status_code == 200
-        assert "data" in response.json()
-    
-    def test_can_create_item(
-        self, client: TestClient, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """Should still be able to create items."""
-        response = client.post(
-            f"{settings.API_V1_STR}/items/",
-            headers=superuser_token_headers,
-            json={"title": "Test Item", "description": "Test Description"},
-        )
-        assert response.status_code == 200
-        assert "id" in response.json()
-    
-    def test_can_get_item(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """Should still be able to get item by ID."""
-        item = create_random_item(db)
-        
-        response = client.get(
-            f"{settings.API_V1_STR}/items/{item.id}",
-            headers=superuser_token_headers,
-        )
-        assert response.status_code == 200
-        assert response.json()["id"] == str(item.id)
-    
-    def test_can_update_item(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+    @pytest.mark.parametrize(
+        ("method", "on_item", "payload", "expected_keys", "expected_values"),
+        [
+            ("GET", False, None, ("data",), {}),
+            ("POST", False, {"title": "Test Item", "description": "Test Description"}, ("id",), {}),
+            ("GET", True, None, (), {"id": _ITEM_ID}),
+            ("PUT", True, {"title": "Updated Title", "description": "Updated"}, (), {"title": "Updated Title"}),
+            ("DELETE", True, None, (), {}),
+        ],
+        ids=["can_list_items", "can_create_item", "can_get_item", "can_update_item", "can_delete_item"],
+    )
+    def test_items_crud_still_works(
+        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str],
+        method: str, on_item: bool, payload: dict | None,
+        expected_keys: tuple[str, ...], expected_values: dict,
     ) -> None:
-        """Should still be able to update items."""
-        item = create_random_item(db)
+        """Should still be able to list, create, get, update and delete items."""
+        item = create_random_item(db) if on_item else None
+        url = f"{_ITEMS_URL}/{item.id}" if item else f"{_ITEMS_URL}/"
         
-        response = client.put(
-            f"{settings.API_V1_STR}/items/{item.id}",
-            headers=superuser_token_headers,
-            json={"title": "Updated Title", "description": "Updated"},
+        response = client.request(
+            method, url, headers=superuser_token_headers, json=payload
         )
         assert response.status_code == 200
-        assert response.json()["title"] == "Updated Title"
-    
-    def test_can_delete_item(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
-    ) -> None:
-        """Should still be able to delete items."""
-        item = create_random_item(db)
         
-        response = client.delete(
-            f"{settings.API_V1_STR}/items/{item.id}",
-            headers=superuser_token_headers,
-        )
-        assert response.status_code == 200
+        data = response.json()
+        for key in expected_keys:
+            assert key in data
+        for key, value in expected_values.items():
+            assert data[key] == (str(item.id) if value is _ITEM_ID else value)
 
 
 class TestPermissionsPreserved:
@@ -216,7 +172,7 @@ class TestPermissionsPreserved:
         self, client: TestClient
     ) -> None:
         """Items endpoint should still require authentication."""
-        response = client.get(f"{settings.API_V1_STR}/items/")
+        response = client.get(f"{_ITEMS_URL}/")
         assert response.status_code in (401, 403)
     
     def test_user_only_sees_own_items(
@@ -225,7 +181,7 @@ class TestPermissionsPreserved:
     ) -> None:
         """Normal user should only see their own items."""
         response = client.get(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=normal_user_token_headers,
         )
         assert response.status_code == 200
@@ -241,7 +197,7 @@ class TestServiceLayerEdgeCases:
         """Item not found should be handled properly."""
         fake_id = str(uuid.uuid4())
         response = client.get(
-            f"{settings.API_V1_STR}/items/{fake_id}",
+            f"{_ITEMS_URL}/{fake_id}",
             headers=superuser_token_headers,
         )
         assert response.status_code == 404
@@ -251,7 +207,7 @@ class TestServiceLayerEdgeCases:
     ) -> None:
         """Invalid input data should be validated."""
         response = client.post(
-            f"{settings.API_V1_STR}/items/",
+            f"{_ITEMS_URL}/",
             headers=superuser_token_headers,
             json={},  # Missing required fields
         )
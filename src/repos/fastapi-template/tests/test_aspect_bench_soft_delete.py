@@ -13,27 +13,47 @@ Tests based SOLELY on prompt requirements:
 """
 
 import uuid
+from collections.abc import Callable, Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from app.core.config import settings
 from app.models import Item
-from tests.utils.item import create_random_item
 
 
 pytestmark = pytest.mark.aspect_bench
 
+# Column/attribute names commonly used to flag a soft-deleted row
+_MARKER_CANDIDATES = ("deleted_at", "is_deleted", "deleted")
+# Items per bulk insert: one for each test below that consumes a fresh item
+_ITEM_BATCH = 11
+
+
+@pytest.fixture(scope="module")
+def item_pool(bulk_items: Callable[[int], list[Item]]) -> Iterator[Item]:
+    """Endless supply of live items, inserted _ITEM_BATCH at a time in one commit."""
+    def _items() -> Iterator[Item]:
+        while True:
+            yield from bulk_items(_ITEM_BATCH)
+    return _items()
+
+
+@pytest.fixture
+def item(item_pool: Iterator[Item]) -> Item:
+    """A live item that no other test in this module has touched."""
+    return next(item_pool)
+
 
 class TestSoftDeleteBasic:
     """Test that soft delete is implemented."""
     
     def test_delete_marks_item_not_removes(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, db: Session, item: Item,
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Deleting an item should mark it, not remove from database."""
-        # Create item
-        item = create_random_item(db)
         item_id = item.id
         
         # Delete it via API
@@ -44,21 +64,19 @@ class TestSoftDeleteBasic:
         assert response.status_code == 200
         
         # Check directly in database - item should still exist
-        db.expire_all()  # Clear cache
-        
-        # Try to find the item in the database
-        statement = select(Item).where(Item.id == item_id)
+        # (populate_existing refreshes the cached instance from this one SELECT)
+        statement = select(Item).where(Item.id == item_id) \
+            .execution_options(populate_existing=True)
         db_item = db.exec(statement).first()
         
         assert db_item is not None, \
             "Item should still exist in database after soft delete"
     
     def test_deleted_item_has_marker(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, db: Session, item: Item,
+        superuser_token_headers: dict[str, str]
     ) -> None:
         """Deleted items should have some marker (deleted_at, is_deleted, etc.)."""
-        # Create and delete item
-        item = create_random_item(db)
         item_id = item.id
         
         response = client.delete(
@@ -67,22 +85,16 @@ class TestSoftDeleteBasic:
         )
         assert response.status_code == 200
         
-        # Check in database for marker
-        db.expire_all()
-        statement = select(Item).where(Item.id == item_id)
+        # Check in database for marker, refreshing the cached instance
+        statement = select(Item).where(Item.id == item_id) \
+            .execution_options(populate_existing=True)
         db_item = db.exec(statement).first()
         
         if db_item is None:
             pytest.fail("Item was hard-deleted, not soft-deleted")
         
-        # Check for common soft-delete markers
-        has_marker = False
-        if hasattr(db_item, "deleted_at") and db_item.deleted_at is not None:
-            has_marker = True
-        elif hasattr(db_item, "is_deleted") and db_item.is_deleted:
-            has_marker = True
-        elif hasattr(db_item, "deleted") and db_item.deleted:
-            has_marker = True
+        # Check for common soft-delete markers (a timestamp or a true flag)
+        has_marker = any(getattr(db_item, name, None) for name in _MARKER_CANDIDATES)
         
         assert has_marker, \
             "Deleted item should have a soft-delete marker (deleted_at, is_deleted, etc.)"
@@ -92,11 +104,9 @@ class TestDeletedItemsHidden:
     """Test that deleted items don't appear in regular queries."""
     
     def test_deleted_item_not_in_list(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Deleted items should not appear in list endpoint."""
-        # Create item
-        item = create_random_item(db)
         item_id = str(item.id)
         item_title = item.title
         
@@ -125,11 +135,9 @@ class TestDeletedItemsHidden:
             "Deleted item should not appear in list"
     
     def test_deleted_item_not_accessible_by_id(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Deleted items should not be accessible via GET by ID."""
-        # Create and delete item
-        item = create_random_item(db)
         item_id = item.id
         
         client.delete(
@@ -148,11 +156,9 @@ class TestDeletedItemsHidden:
             "Deleted item should return 404 when accessed by ID"
     
     def test_deleted_item_not_updateable(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Deleted items should not be updateable."""
-        # Create and delete item
-        item = create_random_item(db)
         item_id = item.id
         
         client.delete(
@@ -196,13 +202,11 @@ class TestTrashEndpoint:
             "Trash endpoint should return 200"
     
     def test_trash_contains_deleted_items(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """
         Trash endpoint should list soft-deleted items.
         """
-        # Create and delete item
-        item = create_random_item(db)
         item_id = str(item.id)
         
         client.delete(
@@ -233,12 +237,11 @@ class TestRestoreEndpoint:
     """
     
     def test_restore_endpoint_exists(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """
         POST /api/v1/items/{id}/restore endpoint must exist.
         """
-        item = create_random_item(db)
         item_id = str(item.id)
         
         # Delete first
@@ -257,12 +260,11 @@ class TestRestoreEndpoint:
             "POST /api/v1/items/{id}/restore endpoint must exist"
     
     def test_restore_brings_back_item(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """
         Restoring an item should make it visible in regular queries again.
         """
-        item = create_random_item(db)
         item_id = str(item.id)
         
         # Delete
@@ -296,12 +298,11 @@ class TestRestoreEndpoint:
             "Restored item should appear in regular item list"
     
     def test_restored_item_removed_from_trash(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """
         Restored item should no longer appear in trash.
         """
-        item = create_random_item(db)
         item_id = str(item.id)
         
         # Delete and restore
@@ -332,11 +333,9 @@ class TestSoftDeleteEdgeCases:
     """Edge cases for soft delete."""
     
     def test_delete_twice_handled(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Deleting an already deleted item should be handled."""
-        # Create and delete item
-        item = create_random_item(db)
         item_id = item.id
         
         # First delete
@@ -356,40 +355,28 @@ class TestSoftDeleteEdgeCases:
         assert response2.status_code in (200, 404)
     
     def test_count_excludes_deleted_items(
-        self, client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+        self, client: TestClient, item: Item, superuser_token_headers: dict[str, str]
     ) -> None:
         """Total count should exclude deleted items."""
-        # Get initial count
+        # Initial count, with the (live) item included
         response1 = client.get(
             f"{settings.API_V1_STR}/items/",
             headers=superuser_token_headers,
         )
         initial_count = response1.json()["count"]
         
-        # Create and delete item
-        item = create_random_item(db)
-        item_id = item.id
-        
-        # Count after creation
-        response2 = client.get(
-            f"{settings.API_V1_STR}/items/",
-            headers=superuser_token_headers,
-        )
-        count_after_create = response2.json()["count"]
-        assert count_after_create == initial_count + 1
-        
         # Delete item
         client.delete(
-            f"{settings.API_V1_STR}/items/{item_id}",
+            f"{settings.API_V1_STR}/items/{item.id}",
             headers=superuser_token_headers,
         )
         
         # Count after deletion
-        response3 = client.get(
+        response2 = client.get(
             f"{settings.API_V1_STR}/items/",
             headers=superuser_token_headers,
         )
-        count_after_delete = response3.json()["count"]
+        count_after_delete = response2.json()["count"]
         
-        assert count_after_delete == initial_count, \
+        assert count_after_delete == initial_count - 1, \
             "Count should decrease after soft delete"
@@ -14,6 +14,9 @@ Tests based SOLELY on prompt requirements:
 5. Applied to HTTP clients
 """
 
+import functools
+import importlib
+import inspect
 import pytest
 import os
 from unittest.mock import patch
@@ -24,6 +27,32 @@ from app.core.config import settings
 pytestmark = pytest.mark.aspect_bench
 
 
+@functools.cache
+def _module_source(module_name: str) -> str:
+    """Source of `module_name`, read from disk once per process."""
+    return inspect.getsource(importlib.import_module(module_name))
+
+
+@functools.cache
+def _settings_source() -> str:
+    """Source of the Settings class, read once per process."""
+    from app.core.config import Settings
+    return inspect.getsource(Settings)
+
+
+@functools.cache
+def _settings_fields() -> tuple[str, ...]:
+    """Declared Settings field names (empty if Settings is not a Pydantic v2 model)."""
+    from app.core.config import Settings
+    return tuple(getattr(Settings, 'model_fields', None) or ())
+
+
+@functools.cache
+def _timeout_fields() -> tuple[str, ...]:
+    """The Settings fields whose name mentions a timeout."""
+    return tuple(f for f in _settings_fields() if 'timeout' in f.lower())
+
+
 class TestTimeoutSettingsExist:
     """Test that timeout settings exist in config."""
     
@@ -87,11 +116,11 @@ class TestTimeoutDefaults:
     
     def test_defaults_are_positive(self) -> None:
         """All timeout defaults should be positive numbers."""
-        for attr in dir(settings):
-            if 'timeout' in attr.lower() and not attr.startswith('_'):
-                value = getattr(settings, attr)
-                if isinstance(value, (int, float)):
-                    assert value > 0, f"{attr} must be positive"
+        # Declared fields only, rather than every attribute dir() finds on the instance
+        for attr in _timeout_fields():
+            value = getattr(settings, attr)
+            if isinstance(value, (int, float)):
+                assert value > 0, f"{attr} must be positive"
 
 
 class TestTimeoutValidation:
@@ -108,10 +137,7 @@ class TestTimeoutValidation:
     
     def test_settings_class_validates(self) -> None:
         """Settings class should validate timeout values."""
-        from app.core.config import Settings
-        import inspect
-        
-        source = inspect.getsource(Settings)
+        source = _settings_source()
         
         # Check for validation patterns
         has_validation = (
@@ -123,7 +149,8 @@ class TestTimeoutValidation:
         )
         
         # Just verify Settings exists and is a Pydantic model
-        assert hasattr(Settings, 'model_fields') or hasattr(Settings, '__fields__')
+        settings_class = type(settings)
+        assert hasattr(settings_class, 'model_fields') or hasattr(settings_class, '__fields__')
 
 
 class TestTimeoutConfigurable:
@@ -131,26 +158,15 @@ class TestTimeoutConfigurable:
     
     def test_connect_timeout_from_env(self) -> None:
         """HTTP_CONNECT_TIMEOUT should be configurable via env var."""
-        from app.core.config import Settings
-        
         # Check if the setting accepts environment variable
-        fields = Settings.model_fields if hasattr(Settings, 'model_fields') else {}
-        
         # The field should exist (with any name)
-        timeout_fields = [f for f in fields if 'timeout' in f.lower()]
-        assert len(timeout_fields) > 0, \
+        assert len(_timeout_fields()) > 0, \
             "Settings should have timeout configuration fields"
     
     def test_all_timeouts_are_settings_fields(self) -> None:
         """All timeout configs should be proper settings fields."""
-        from app.core.config import Settings
-        
         # Check that timeout-related fields exist
-        fields = Settings.model_fields if hasattr(Settings, 'model_fields') else {}
-        field_names = [f.lower() for f in fields]
-        
-        has_timeouts = any('timeout' in f for f in field_names)
-        assert has_timeouts, "Settings should have timeout fields"
+        assert _timeout_fields(), "Settings should have timeout fields"
 
 
 class TestTimeoutsApplied:
@@ -158,12 +174,9 @@ class TestTimeoutsApplied:
     
     def test_timeout_settings_used_somewhere(self) -> None:
         """Timeout settings should be used in the codebase."""
-        import inspect
-        
         # Check if settings timeouts are referenced
         try:
-            from app import utils
-            source = inspect.getsource(utils)
+            source = _module_source('app.utils')
             
             uses_timeout = (
                 'timeout' in source.lower() or
@@ -174,8 +187,7 @@ class TestTimeoutsApplied:
             if not uses_timeout:
                 # Check email module specifically
                 try:
-                    from app.utils import email as email_module
-                    email_source = inspect.getsource(email_module)
+                    email_source = _module_source('app.utils.email')
                     uses_timeout = 'timeout' in email_source.lower()
                 except:
                     pass
@@ -15,6 +15,8 @@ Modes:
     --with-regression: Run task tests + regression tests (catch side effects)
     --regression-only: Run only regression tests (use to verify baseline)
 
+Pass --workers N (or "auto") to shard tests across pytest-xdist workers.
+
 Returns exit code 0 if all tests pass, non-zero if any fail.
 """
 
@@ -58,6 +60,14 @@ def run_pytest_command(cmd_parts: list, cwd: Path, capture: bool = False) -> int
         return 1
 
 
+def xdist_args(workers: str | None) -> list[str]:
+    """pytest-xdist arguments for the requested worker count (none if not set)."""
+    if not workers:
+        return []
+    # loadscope keeps each test class on one worker so class/module fixtures run once
+    return ["-n", str(workers), "--dist=loadscope"]
+
+
 def get_test_file_for_task(repo_name: str, task_id: str) -> Path | None:
     """Get the test file path for a task."""
     tests_dir = get_repo_tests_dir(repo_name)
@@ -142,7 +152,9 @@ def run_regression_tests(repo_name: str, verbose: bool = False, capture: bool =
     return run_pytest_command(cmd_parts, work_dir, capture)
 
 
-def run_all_benchmark_tests(repo_name: str, verbose: bool = False, capture: bool = False) -> int:
+def run_all_benchmark_tests(
+    repo_name: str, verbose: bool = False, capture: bool = False, workers: str | None = None
+) -> int:
     """
     Run all benchmark tests for a repository.
 
@@ -168,6 +180,7 @@ def run_all_benchmark_tests(repo_name: str, verbose: bool = False, capture: bool
     cmd_parts = ["pytest"]
     cmd_parts.extend([str(f) for f in test_files])
     cmd_parts.extend(["-m", "aspect_bench"])
+    cmd_parts.extend(xdist_args(workers))
 
     if verbose:
         cmd_parts.append("-v")
@@ -188,6 +201,7 @@ def run_tests_for_task(
     verbose: bool = False,
     capture: bool = False,
     with_regression: bool = False,
+    workers: str | None = None,
 ) -> int:
     """
     Run the tests for a specific task.
@@ -198,6 +212,7 @@ def run_tests_for_task(
         verbose: Show verbose test output
         capture: Capture output instead of streaming
         with_regression: Also run regression tests
+        workers: pytest-xdist worker count ("auto" or a number); None runs serially
 
     Returns:
         Exit code (0 = pass, non-zero = fail)
@@ -228,6 +243,7 @@ def run_tests_for_task(
         "-m",
         "aspect_bench",
     ]
+    cmd_parts.extend(xdist_args(workers))
 
     if verbose:
         cmd_parts.append("-v")
@@ -290,6 +306,9 @@ Examples:
   
   # Run with regression tests
   python run_tests_for_task.py --repo fastapi-template --task-id refactor-auth-dependency --with-regression
+
+  # Shard a task's tests across pytest-xdist workers
+  python run_tests_for_task.py --repo fastapi-template --task-id streaming-file-upload --workers auto
 """,
     )
     parser.add_argument(
@@ -320,6 +339,11 @@ Examples:
     parser.add_argument(
         "--regression-only", action="store_true", help="Run only regression tests (no task tests)"
     )
+    parser.add_argument(
+        "--workers",
+        "-n",
+        help="Run tests across pytest-xdist workers ('auto' or a number; requires pytest-xdist)",
+    )
 
     args = parser.parse_args()
 
@@ -341,7 +365,7 @@ Examples:
         sys.exit(exit_code)
 
     if args.all:
-        exit_code = run_all_benchmark_tests(args.repo, args.verbose, args.capture)
+        exit_code = run_all_benchmark_tests(args.repo, args.verbose, args.capture, args.workers)
         sys.exit(exit_code)
 
     if not args.task_id:
@@ -355,6 +379,7 @@ Examples:
         verbose=args.verbose,
         capture=args.capture,
         with_regression=args.with_regression,
+        workers=args.workers,
     )
     sys.exit(exit_code)
 